@@ -0,0 +1,45 @@
+"""
+VetrAI Platform - Service Endpoints
+Ports, health URLs and the pooled HTTP session shared by the platform helper scripts
+"""
+
+# Backend services as (name, port), in port order
+BACKEND_SERVICES = (
+    ("Auth", 8001),
+    ("Tenancy", 8002),
+    ("Keys", 8003),
+    ("Billing", 8004),
+    ("Support", 8005),
+    ("Themes", 8006),
+    ("Notifications", 8007),
+    ("Workers", 8008)
+)
+
+# Frontend applications as (port, name)
+FRONTENDS = (
+    (3000, "Studio UI"),
+    (3001, "Admin Dashboard")
+)
+
+# Derived once at import so callers never rebuild them
+BACKEND_PORTS = tuple(port for name, port in BACKEND_SERVICES)
+HEALTH_ENDPOINTS = tuple((name, f"http://localhost:{port}/health") for name, port in BACKEND_SERVICES)
+
+# Shared session so probes reuse pooled keep-alive connections; requests is
+# imported on first use so importing this module stays cheap
+_session = None
+
+def get_session():
+    """Return the shared pooled session, creating it on first use"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _session = requests.Session()
+        _session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+    return _session
+
+def close_session():
+    """Close the shared session's pooled connections if it was ever created"""
+    if _session is not None:
+        _session.close()
@@ -11,21 +11,123 @@ This script performs comprehensive analysis of the VetrAI codebase including:
 - Documentation coverage
 """
 
+import io
 import os
 import sys
+import ast
 import json
 import re
+import heapq
+import hashlib
+import warnings
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Tuple, Any
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Any, NamedTuple, Optional
+from datetime import date
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Directories never descended into by the repository walk
+_EXCLUDE_DIRS = frozenset({'.git', '__pycache__', 'node_modules', 'venv', '.venv'})
+# Build artifacts and CI config: still indexed for docs/quality, excluded from code metrics
+_METRICS_EXCLUDE_DIRS = frozenset({'dist', 'build', '.github'})
+
+# Persistent results cache, reused while no file in the repository has changed
+CACHE_FILE_NAME = '.codebase_analysis_cache.json'
+# Bump whenever analyzer output changes so stale caches are ignored
+_CACHE_VERSION = 3
+# Non-source files whose contents the analyzers read; every other file that is not
+# Python or Markdown only counts by its presence, so it is never hashed
+_CONTENT_FILE_NAMES = frozenset({'requirements.txt'})
+
+# Buffer size for streaming saved JSON results to disk
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of longest files kept in the quality results
+MAX_LONG_FILES = 10
+
+# Source files above this size, or with NUL bytes in their first block, are not analyzed
+MAX_SOURCE_FILE_SIZE = 2 * 1024 * 1024
+_BINARY_SNIFF_SIZE = 4096
+
+# FastAPI route decorators on either a router or the app itself
+_RE_ROUTE = re.compile(r'@(?:router|app)\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']')
+# Class definitions that inherit from Base
+_RE_MODEL = re.compile(r'class\s+(\w+)\s*\([^)]*Base[^)]*\):')
+# Port hints in uvicorn.run or similar, tried in order
+_PORT_PATTERNS = (
+    re.compile(r'port\s*=\s*(\d+)'),
+    re.compile(r'--port\s+(\d+)'),
+    re.compile(r':(\d{4,5})\b'),  # Look for :8001, :8002, etc.
+)
+# package==version or package>=version, handling dots, hyphens, underscores and extras
+_RE_REQ = re.compile(r'([a-zA-Z0-9\-_.]+(?:\[[a-zA-Z0-9\-_,]+\])?)\s*([=><!]+)\s*([0-9.]+)')
+_RE_REQ_NAME = re.compile(r'([a-zA-Z0-9\-_.]+(?:\[[a-zA-Z0-9\-_,]+\])?)')
+# Character classes for the regex-free requirements fast path
+_REQ_NAME_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.'
+_REQ_OPERATOR_CHARS = '=<>!'
+_REQ_VERSION_CHARS = '0123456789.'
+# Potential hardcoded credentials, matched against lowercased source
+_RE_ANY_SECRET = re.compile(r'(?:password|api[_-]?key|secret)\s*=\s*["\'][^"\']+["\']')
+# Substrings that must appear (lowercased) before the hardcoded-secret regexes can match
+_SECRET_KEYWORDS = ('password', 'secret', 'api_key', 'apikey', 'api-key')
+_RE_DEF = re.compile(r'\n\s*def\s+\w+')
+# Whole-text line classification for code metrics
+_RE_BLANK_LINE = re.compile(r'^[ \t\f\v]*$', re.MULTILINE)
+_RE_COMMENT_LINE = re.compile(r'^[ \t\f\v]*#', re.MULTILINE)
+
+# File-extension dispatch for code metrics counters
+_EXT_TO_BUCKET = {
+    '.py': 'python_files',
+    '.js': 'javascript_files', '.jsx': 'javascript_files',
+    '.ts': 'javascript_files', '.tsx': 'javascript_files',
+    '.md': 'markdown_files',
+    '.yml': 'yaml_files', '.yaml': 'yaml_files',
+}
+_DOCKERFILE_NAMES = frozenset({'dockerfile', 'dockerfile.dev', 'dockerfile.prod'})
+
+_HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch'})
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+class SkippedFileError(Exception):
+    """Raised when a file is too large or binary to be analyzed as source"""
+
+
+class IndexedFile(NamedTuple):
+    """A file discovered by the shared repository walk"""
+    path: Path
+    suffix: str
+    is_py: bool
+    is_md: bool
+    is_test: bool
+    top_dir: str
+    in_metrics_scope: bool
+    size: int
+    mtime_ns: int
 
 
 class CodeAnalyzer:
     """Main class for analyzing the VetrAI codebase"""
     
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", use_cache: bool = True,
+                 output_files: Tuple[str, ...] = ("CODEBASE_ANALYSIS.md", "codebase_analysis.json")):
         self.repo_path = Path(repo_path).resolve()
+        self.use_cache = use_cache
+        # Derived paths are fixed for the analyzer's lifetime, so build them once
+        self._cache_path = self.repo_path.joinpath(CACHE_FILE_NAME)
+        self._services_path = self.repo_path.joinpath("services")
+        self._docs_path = self.repo_path.joinpath("docs")
+        # Our own reports are rewritten (with a fresh timestamp) every run, so they must not bust the cache
+        self._cache_ignored = frozenset((CACHE_FILE_NAME,) + tuple(output_files))
+        # Paths under the repo start with this prefix; slicing it off is cheaper than relative_to()
+        self._repo_prefix = os.path.join(str(self.repo_path), '')
         self.results = {
             "summary": {},
             "code_metrics": {},
@@ -33,14 +135,33 @@ class CodeAnalyzer:
             "dependencies": {},
             "security": {},
             "documentation": {},
-            "quality": {}
+            "quality": {},
+            "skipped_files": {}
         }
+        self._file_index: Optional[List[IndexedFile]] = None
+        self._metrics_dir_count = 0
+        self._text_cache: Dict[Path, Tuple[int, str]] = {}
+        self._ast_cache: Dict[Path, Tuple[str, Optional[ast.Module]]] = {}
     
     def analyze(self) -> Dict[str, Any]:
         """Run all analysis tasks"""
         print("🔍 Starting VetrAI Codebase Analysis...")
         print(f"📁 Repository Path: {self.repo_path}\n")
         
+        cache_key = file_signatures = None
+        if self.use_cache:
+            cache = self._load_cache()
+            cache_key, file_signatures = self._compute_cache_key(cache.get("files", {}))
+            if cache.get("key") == cache_key:
+                print("♻️  No changes since the last run, reusing cached analysis results\n")
+                self.results = cache["results"]
+                # JSON round-trips drop the Counter type that the report relies on
+                dependencies = self.results["dependencies"]
+                dependencies["common_packages"] = Counter(dependencies.get("common_packages", {}))
+                self.generate_summary()
+                return self.results
+        
+        self._prefetch_sources()
         self.analyze_code_metrics()
         self.analyze_services()
         self.analyze_dependencies()
@@ -49,8 +170,185 @@ class CodeAnalyzer:
         self.analyze_code_quality()
         self.generate_summary()
         
+        if self.use_cache:
+            self._save_cache(cache_key, file_signatures)
+        
         return self.results
     
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the persistent results cache, or an empty one if missing or stale"""
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+            return {}
+        return cache
+    
+    def _compute_cache_key(self, cached_files: Dict[str, List]) -> Tuple[str, Dict[str, List]]:
+        """Hash the analyzed file contents, re-hashing only files whose mtime or size changed"""
+        file_signatures = {}
+        key = hashlib.sha1(str(_CACHE_VERSION).encode())
+        for entry in self._walk_once():
+            rel_path = self._rel_path(entry.path)
+            if rel_path in self._cache_ignored:
+                continue
+            if not (entry.is_py or entry.is_md or entry.path.name in _CONTENT_FILE_NAMES):
+                # Counted in the metrics but never read: its path is all the results depend on
+                key.update(f"{rel_path}\0\0".encode())
+                continue
+            cached = cached_files.get(rel_path)
+            if cached and cached[0] == entry.mtime_ns and cached[1] == entry.size:
+                digest = cached[2]
+            else:
+                try:
+                    # Content hash keeps regenerated-but-identical files (e.g. reports) cache-friendly
+                    digest = hashlib.sha1(entry.path.read_bytes()).hexdigest()
+                except OSError:
+                    # Unreadable files still count towards metrics, so their presence is keyed
+                    digest = ''
+            file_signatures[rel_path] = [entry.mtime_ns, entry.size, digest]
+            key.update(f"{rel_path}\0{digest}\0".encode())
+        return key.hexdigest(), file_signatures
+    
+    def _save_cache(self, cache_key: str, file_signatures: Dict[str, List]):
+        """Persist results together with the file signatures they were computed from"""
+        cache = {
+            "version": _CACHE_VERSION,
+            "key": cache_key,
+            "files": file_signatures,
+            "results": self.results
+        }
+        try:
+            with open(self._cache_path, 'w', encoding='utf-8', buffering=JSON_WRITE_BUFFER_SIZE) as f:
+                json.dump(cache, f, default=str)
+        except OSError as e:
+            print(f"  ⚠️  Could not write analysis cache {self._cache_path}: {e}")
+    
+    def _walk_once(self) -> List[IndexedFile]:
+        """Walk the repository once and cache the file index shared by all analyzers"""
+        if self._file_index is None:
+            self._file_index = []
+            self._metrics_dir_count = 0
+            self._scan_dir(str(self.repo_path), "", True)
+        return self._file_index
+    
+    def _scan_dir(self, directory: str, top_dir: str, in_metrics_scope: bool):
+        """Recursively index a directory with os.scandir, pruning excluded dirs in place"""
+        subdirs = []
+        has_files = False
+        in_tests_dir = os.path.basename(directory) == 'tests'
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        # Match os.walk: symlinked dirs are neither files nor descended into
+                        if not entry.is_symlink() and name not in _EXCLUDE_DIRS:
+                            subdirs.append(entry)
+                        continue
+                    
+                    has_files = True
+                    path = Path(entry.path)
+                    try:
+                        # DirEntry caches its stat, so this is the only stat the walk needs
+                        stat = entry.stat()
+                        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                    except OSError:
+                        # e.g. a dangling symlink; readers will report it when they open it
+                        size = mtime_ns = -1
+                    suffix = os.path.splitext(name)[1].lower()
+                    self._file_index.append(IndexedFile(
+                        path=path,
+                        suffix=suffix,
+                        is_py=suffix == '.py',
+                        is_md=suffix == '.md',
+                        is_test=in_tests_dir or 'test' in name.lower(),
+                        top_dir=top_dir,
+                        in_metrics_scope=in_metrics_scope,
+                        size=size,
+                        mtime_ns=mtime_ns
+                    ))
+        except OSError as e:
+            print(f"  ⚠️  Error scanning {directory}: {e}")
+            return
+        
+        # Each directory is visited exactly once, so this counts distinct dirs with files
+        if has_files and in_metrics_scope:
+            self._metrics_dir_count += 1
+        
+        for entry in subdirs:
+            self._scan_dir(entry.path, top_dir or entry.name,
+                           in_metrics_scope and entry.name not in _METRICS_EXCLUDE_DIRS)
+    
+    def _rel_path(self, file_path: Path) -> str:
+        """Return a path under the repository as a repo-relative string"""
+        return str(file_path)[len(self._repo_prefix):]
+    
+    def _read_text(self, file_path: Path) -> str:
+        """Read and decode a file once, reusing the cached text while its mtime is unchanged"""
+        stat = file_path.stat()
+        cached = self._text_cache.get(file_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns:
+            return cached[1]
+        
+        if stat.st_size > MAX_SOURCE_FILE_SIZE:
+            self._skip_file(file_path, f"larger than {MAX_SOURCE_FILE_SIZE // (1024 * 1024)} MiB")
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            # Sniff the first block so binary files are not decoded in full
+            content = f.read(_BINARY_SNIFF_SIZE)
+            if '\x00' in content:
+                self._skip_file(file_path, "binary content")
+            content += f.read()
+        self._text_cache[file_path] = (stat.st_mtime_ns, content)
+        return content
+    
+    def _skip_file(self, file_path: Path, reason: str):
+        """Record a file that will not be analyzed and abort reading it"""
+        rel_path = self._rel_path(file_path)
+        self.results["skipped_files"][rel_path] = reason
+        raise SkippedFileError(f"skipped ({reason})")
+    
+    def _prefetch_sources(self):
+        """Read Python and Markdown files concurrently to warm the text cache"""
+        paths = [entry.path for entry in self._walk_once() if entry.is_py or entry.is_md]
+        if not paths:
+            return
+        
+        def read(file_path: Path):
+            try:
+                self._read_text(file_path)
+            except Exception:
+                # The analyzer that needs this file will retry and report the error
+                pass
+        
+        # Reads release the GIL, so threads overlap the I/O; parsing stays serial
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            list(executor.map(read, paths))
+    
+    def _parse_module(self, file_path: Path) -> Optional[ast.Module]:
+        """Parse a Python file once, returning None if it is not valid Python"""
+        content = self._read_text(file_path)
+        cached = self._ast_cache.get(file_path)
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        
+        try:
+            with warnings.catch_warnings():
+                # Invalid escape sequences etc. in analyzed code are not our concern
+                warnings.simplefilter('ignore')
+                tree = ast.parse(content, filename=str(file_path))
+        except (SyntaxError, ValueError):
+            tree = None
+        self._ast_cache[file_path] = (content, tree)
+        return tree
+    
+    @staticmethod
+    def _count_lines(content: str) -> int:
+        """Count lines the way len(file.readlines()) would"""
+        return content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+    
     def analyze_code_metrics(self):
         """Analyze code metrics including LOC, file counts, etc."""
         print("📊 Analyzing Code Metrics...")
@@ -66,45 +364,36 @@ class CodeAnalyzer:
             "python_lines": 0,
             "blank_lines": 0,
             "comment_lines": 0,
-            "directories": set()
+            "directories": 0
         }
         
-        for root, dirs, files in os.walk(self.repo_path):
-            # Skip common exclusions
-            dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', 'node_modules', 
-                                                     'venv', '.venv', 'dist', 'build', '.github']]
+        for entry in self._walk_once():
+            if not entry.in_metrics_scope:
+                continue
             
-            for file in files:
-                file_path = Path(root) / file
-                metrics["total_files"] += 1
-                
-                if file.endswith('.py'):
-                    metrics["python_files"] += 1
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = f.readlines()
-                            metrics["python_lines"] += len(lines)
-                            for line in lines:
-                                stripped = line.strip()
-                                if not stripped:
-                                    metrics["blank_lines"] += 1
-                                elif stripped.startswith('#'):
-                                    metrics["comment_lines"] += 1
-                    except Exception as e:
-                        print(f"  ⚠️  Error reading {file_path}: {e}")
-                
-                elif file.endswith(('.js', '.jsx', '.ts', '.tsx')):
-                    metrics["javascript_files"] += 1
-                elif file.endswith('.md'):
-                    metrics["markdown_files"] += 1
-                elif file.endswith(('.yml', '.yaml')):
-                    metrics["yaml_files"] += 1
-                elif file.lower() in ['dockerfile', 'dockerfile.dev', 'dockerfile.prod']:
-                    metrics["dockerfile_count"] += 1
-                
-                metrics["directories"].add(Path(root).relative_to(self.repo_path))
-        
-        metrics["directories"] = len(metrics["directories"])
+            file_path = entry.path
+            metrics["total_files"] += 1
+            
+            bucket = _EXT_TO_BUCKET.get(entry.suffix)
+            if bucket:
+                metrics[bucket] += 1
+            elif file_path.name.lower() in _DOCKERFILE_NAMES:
+                metrics["dockerfile_count"] += 1
+            
+            if entry.is_py:
+                try:
+                    content = self._read_text(file_path)
+                    metrics["python_lines"] += self._count_lines(content)
+                    blank_lines = len(_RE_BLANK_LINE.findall(content))
+                    if not content or content.endswith('\n'):
+                        # '$' also matches the empty tail after the final newline
+                        blank_lines -= 1
+                    metrics["blank_lines"] += blank_lines
+                    metrics["comment_lines"] += len(_RE_COMMENT_LINE.findall(content))
+                except Exception as e:
+                    print(f"  ⚠️  Error reading {file_path}: {e}")
+        
+        metrics["directories"] = self._metrics_dir_count
         metrics["code_lines"] = metrics["python_lines"] - metrics["blank_lines"] - metrics["comment_lines"]
         
         self.results["code_metrics"] = metrics
@@ -116,7 +405,7 @@ class CodeAnalyzer:
         """Analyze microservices architecture"""
         print("🏗️  Analyzing Service Architecture...")
         
-        services_path = self.repo_path / "services"
+        services_path = self._services_path
         if not services_path.exists():
             print("  ⚠️  Services directory not found\n")
             return
@@ -127,7 +416,7 @@ class CodeAnalyzer:
             if service_dir.is_dir() and service_dir.name != 'shared':
                 service_name = service_dir.name
                 service_info = {
-                    "path": str(service_dir.relative_to(self.repo_path)),
+                    "path": self._rel_path(service_dir),
                     "files": [],
                     "endpoints": [],
                     "models": [],
@@ -183,17 +472,27 @@ class CodeAnalyzer:
         """Extract API endpoints from routes file"""
         endpoints = []
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            tree = self._parse_module(file_path)
+            if tree is None:
                 # Look for FastAPI route decorators
-                patterns = [
-                    r'@router\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']',
-                    r'@app\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']'
-                ]
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
-                    for method, path in matches:
-                        endpoints.append(f"{method.upper()} {path}")
+                for method, path in _RE_ROUTE.findall(self._read_text(file_path)):
+                    endpoints.append(f"{method.upper()} {path}")
+                return endpoints
+            
+            for node in ast.walk(tree):
+                if not isinstance(node, _FUNCTION_NODES):
+                    continue
+                for decorator in node.decorator_list:
+                    # Match @router.get("/path") / @app.post("/path")
+                    if not (isinstance(decorator, ast.Call) and decorator.args
+                            and isinstance(decorator.func, ast.Attribute)
+                            and decorator.func.attr in _HTTP_METHODS
+                            and isinstance(decorator.func.value, ast.Name)
+                            and decorator.func.value.id in ('router', 'app')):
+                        continue
+                    path = decorator.args[0]
+                    if isinstance(path, ast.Constant) and isinstance(path.value, str):
+                        endpoints.append(f"{decorator.func.attr.upper()} {path.value}")
         except Exception as e:
             pass
         return endpoints
@@ -202,12 +501,18 @@ class CodeAnalyzer:
         """Extract SQLAlchemy models from models file"""
         models = []
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                # Look for class definitions that inherit from Base
-                pattern = r'class\s+(\w+)\s*\([^)]*Base[^)]*\):'
-                matches = re.findall(pattern, content)
-                models = matches
+            tree = self._parse_module(file_path)
+            if tree is None:
+                return _RE_MODEL.findall(self._read_text(file_path))
+            
+            # Look for class definitions that inherit from Base (or BaseModel etc.)
+            for node in ast.walk(tree):
+                if isinstance(node, ast.ClassDef):
+                    for base in node.bases:
+                        base_name = base.id if isinstance(base, ast.Name) else getattr(base, 'attr', '')
+                        if 'Base' in base_name:
+                            models.append(node.name)
+                            break
         except Exception as e:
             pass
         return models
@@ -215,21 +520,15 @@ class CodeAnalyzer:
     def _extract_port(self, file_path: Path) -> str:
         """Extract port number from main.py"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                # Look for port in uvicorn.run or similar (more flexible pattern)
-                patterns = [
-                    r'port\s*=\s*(\d+)',
-                    r'--port\s+(\d+)',
-                    r':(\d{4,5})\b'  # Look for :8001, :8002, etc.
-                ]
-                for pattern in patterns:
-                    match = re.search(pattern, content)
-                    if match:
-                        port = match.group(1)
-                        # Validate it's a reasonable port number
-                        if 1000 <= int(port) <= 65535:
-                            return port
+            content = self._read_text(file_path)
+            # Look for port in uvicorn.run or similar (more flexible pattern)
+            for pattern in _PORT_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    port = match.group(1)
+                    # Validate it's a reasonable port number
+                    if 1000 <= int(port) <= 65535:
+                        return port
         except Exception as e:
             pass
         return None
@@ -240,11 +539,11 @@ class CodeAnalyzer:
         
         dependencies = {
             "services": {},
-            "common_packages": defaultdict(int),
+            "common_packages": Counter(),
             "version_conflicts": []
         }
         
-        services_path = self.repo_path / "services"
+        services_path = self._services_path
         if services_path.exists():
             for service_dir in services_path.iterdir():
                 if service_dir.is_dir():
@@ -252,12 +551,10 @@ class CodeAnalyzer:
                     if req_file.exists():
                         deps = self._parse_requirements(req_file)
                         dependencies["services"][service_dir.name] = deps
-                        for pkg, version in deps.items():
-                            dependencies["common_packages"][pkg] += 1
+                        dependencies["common_packages"].update(deps.keys())
         
-        # Sort common packages by usage count
-        top_packages = sorted(dependencies["common_packages"].items(), 
-                            key=lambda x: x[1], reverse=True)[:10]
+        # Most used packages first
+        top_packages = dependencies["common_packages"].most_common(10)
         
         self.results["dependencies"] = dependencies
         print(f"  ✓ Analyzed {len(dependencies['services'])} service dependencies")
@@ -270,25 +567,56 @@ class CodeAnalyzer:
         """Parse requirements.txt file"""
         requirements = {}
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and not line.startswith('-'):
-                        # Parse package==version or package>=version
-                        # Updated regex to handle dots, hyphens, underscores, and brackets
-                        match = re.match(r'([a-zA-Z0-9\-_.]+(?:\[[a-zA-Z0-9\-_,]+\])?)\s*([=><!]+)\s*([0-9.]+)', line)
-                        if match:
-                            pkg, op, version = match.groups()
-                            requirements[pkg] = f"{op}{version}"
-                        elif not any(op in line for op in ['==', '>=', '<=', '>', '<', '!=']):
-                            # Package without version specifier
-                            pkg = re.match(r'([a-zA-Z0-9\-_.]+(?:\[[a-zA-Z0-9\-_,]+\])?)', line)
-                            if pkg:
-                                requirements[pkg.group(1)] = "any"
+            for line in file_path.read_text(encoding='utf-8', errors='ignore').splitlines():
+                line = line.strip()
+                if line and not line.startswith('#') and not line.startswith('-'):
+                    parsed = self._split_requirement(line)
+                    if parsed:
+                        pkg, spec = parsed
+                        requirements[pkg] = spec
+                        continue
+                    
+                    # Parse package==version or package>=version
+                    # Updated regex to handle dots, hyphens, underscores, and brackets
+                    match = _RE_REQ.match(line)
+                    if match:
+                        pkg, op, version = match.groups()
+                        requirements[pkg] = f"{op}{version}"
+                    elif not any(op in line for op in ['==', '>=', '<=', '>', '<', '!=']):
+                        # Package without version specifier
+                        pkg = _RE_REQ_NAME.match(line)
+                        if pkg:
+                            requirements[pkg.group(1)] = "any"
         except Exception as e:
             pass
         return requirements
     
+    @staticmethod
+    def _split_requirement(line: str) -> Optional[Tuple[str, str]]:
+        """Parse a plain 'package[extras]<op>version' line without regex, or return None"""
+        op_start = len(line)
+        for char in _REQ_OPERATOR_CHARS:
+            index = line.find(char, 0, op_start)
+            if index != -1:
+                op_start = index
+        if op_start == len(line):
+            return None
+        
+        op_end = op_start + 1
+        while op_end < len(line) and line[op_end] in _REQ_OPERATOR_CHARS:
+            op_end += 1
+        pkg = line[:op_start].rstrip()
+        version = line[op_end:].strip()
+        
+        name, bracket, extras = pkg.partition('[')
+        if bracket and not (len(extras) > 1 and extras.endswith(']')
+                            and not extras[:-1].strip(_REQ_NAME_CHARS + ',')):
+            return None
+        # Anything beyond a bare dotted version (markers, wildcards, ...) goes to the regex
+        if not name or name.strip(_REQ_NAME_CHARS) or not version or version.strip(_REQ_VERSION_CHARS):
+            return None
+        return pkg, f"{line[op_start:op_end]}{version}"
+    
     def analyze_documentation(self):
         """Analyze documentation coverage"""
         print("📚 Analyzing Documentation...")
@@ -304,29 +632,26 @@ class CodeAnalyzer:
         }
         
         # Find all markdown files
-        for root, dirs, files in os.walk(self.repo_path):
-            dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', 'venv', '.venv']]
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = Path(root) / file
-                    rel_path = file_path.relative_to(self.repo_path)
-                    docs["markdown_files"].append(str(rel_path))
-                    
-                    # Count lines
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            docs["total_doc_lines"] += len(f.readlines())
-                    except:
-                        pass
-                    
-                    # Check for key documentation files
-                    if file.upper() == 'README.MD':
-                        docs["readme_found"] = True
-                    elif file.upper() == 'CONTRIBUTING.MD':
-                        docs["contributing_found"] = True
+        for entry in self._walk_once():
+            if entry.is_md:
+                file_path = entry.path
+                file = file_path.name
+                docs["markdown_files"].append(self._rel_path(file_path))
+                
+                # Count lines
+                try:
+                    docs["total_doc_lines"] += self._count_lines(self._read_text(file_path))
+                except:
+                    pass
+                
+                # Check for key documentation files
+                if file.upper() == 'README.MD':
+                    docs["readme_found"] = True
+                elif file.upper() == 'CONTRIBUTING.MD':
+                    docs["contributing_found"] = True
         
         # Check for specific documentation directories
-        docs_path = self.repo_path / "docs"
+        docs_path = self._docs_path
         if docs_path.exists():
             if (docs_path / "api").exists():
                 docs["api_docs"] = True
@@ -369,45 +694,38 @@ class CodeAnalyzer:
         security["dockerignore_found"] = (self.repo_path / ".dockerignore").exists()
         
         # Scan Python files for security patterns
-        for root, dirs, files in os.walk(self.repo_path / "services"):
-            dirs[:] = [d for d in dirs if d not in ['__pycache__', 'venv', '.venv']]
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            
-                            # Check for JWT usage
-                            if 'jwt' in content.lower() or 'jose' in content.lower():
-                                security["security_patterns"]["jwt_usage"] = True
-                            
-                            # Check for password hashing
-                            if 'bcrypt' in content.lower() or 'hash_password' in content:
-                                security["security_patterns"]["password_hashing"] = True
-                            
-                            # Check for SQL parameterization (good practice for SQLAlchemy/FastAPI)
-                            # Look for parameterized queries with proper ORM usage
-                            if ('session.query' in content or 'session.execute' in content or 
-                                'select(' in content or '.filter(' in content):
-                                security["security_patterns"]["sql_parameterization"] = True
-                            
-                            # Look for potential hardcoded credentials (basic check)
-                            patterns = [
-                                r'password\s*=\s*["\'][^"\']+["\']',
-                                r'api[_-]?key\s*=\s*["\'][^"\']+["\']',
-                                r'secret\s*=\s*["\'][^"\']+["\']'
-                            ]
-                            for pattern in patterns:
-                                matches = re.findall(pattern, content, re.IGNORECASE)
-                                if matches:
-                                    rel_path = file_path.relative_to(self.repo_path)
-                                    # Filter out obvious false positives
-                                    if 'example' not in str(rel_path).lower():
-                                        security["secrets_in_code"].append(str(rel_path))
-                                        break
-                    except Exception as e:
-                        pass
+        for entry in self._walk_once():
+            if entry.is_py and entry.top_dir == "services":
+                file_path = entry.path
+                try:
+                    content = self._read_text(file_path)
+                    content_lower = content.lower()
+                    
+                    # Check for JWT usage
+                    if 'jwt' in content_lower or 'jose' in content_lower:
+                        security["security_patterns"]["jwt_usage"] = True
+                    
+                    # Check for password hashing
+                    if 'bcrypt' in content_lower or 'hash_password' in content:
+                        security["security_patterns"]["password_hashing"] = True
+                    
+                    # Check for SQL parameterization (good practice for SQLAlchemy/FastAPI)
+                    # Look for parameterized queries with proper ORM usage
+                    if ('session.query' in content or 'session.execute' in content or 
+                        'select(' in content or '.filter(' in content):
+                        security["security_patterns"]["sql_parameterization"] = True
+                    
+                    # Look for potential hardcoded credentials (basic check).
+                    # A plain substring test rules out most files before any regex runs.
+                    if not any(keyword in content_lower for keyword in _SECRET_KEYWORDS):
+                        continue
+                    if _RE_ANY_SECRET.search(content_lower):
+                        rel_path = self._rel_path(file_path)
+                        # Filter out obvious false positives
+                        if 'example' not in rel_path.lower():
+                            security["secrets_in_code"].append(rel_path)
+                except Exception as e:
+                    pass
         
         self.results["security"] = security
         print(f"  {'✓' if security['env_example_found'] else '✗'} .env.example file")
@@ -437,58 +755,73 @@ class CodeAnalyzer:
         
         total_functions = 0
         total_function_lines = 0
+        # Min-heap of (line_count, path) holding only the longest files seen so far
+        long_files_heap = []
         
-        for root, dirs, files in os.walk(self.repo_path):
-            dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', 'node_modules', 'venv', '.venv']]
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = Path(root) / file
+        for entry in self._walk_once():
+            if entry.is_py:
+                file_path = entry.path
+                
+                # Count test files
+                if entry.is_test:
+                    quality["test_files"] += 1
+                
+                try:
+                    content = self._read_text(file_path)
+                    line_count = self._count_lines(content)
+                    tree = self._parse_module(file_path)
                     
-                    # Count test files
-                    if 'test' in file.lower() or file_path.parent.name == 'tests':
-                        quality["test_files"] += 1
+                    # Check for module docstring
+                    if tree is not None:
+                        has_docstring = ast.get_docstring(tree, clean=False) is not None
+                    else:
+                        has_docstring = content.strip().startswith(('"""', "'''"))
+                    if has_docstring:
+                        quality["python_files_with_docstrings"] += 1
+                    else:
+                        quality["python_files_without_docstrings"] += 1
                     
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            lines = content.split('\n')
-                            
-                            # Check for module docstring
-                            if content.strip().startswith('"""') or content.strip().startswith("'''"):
-                                quality["python_files_with_docstrings"] += 1
-                            else:
-                                quality["python_files_without_docstrings"] += 1
-                            
-                            # Check for type hints
-                            if '->' in content or ': ' in content:
-                                quality["files_with_type_hints"] += 1
-                            
-                            # Check file length
-                            if len(lines) > 500:
-                                rel_path = file_path.relative_to(self.repo_path)
-                                quality["long_files"].append((str(rel_path), len(lines)))
-                            
-                            # Count functions and their lengths (basic)
-                            func_count = len(re.findall(r'\n\s*def\s+\w+', content))
-                            if func_count > 0:
-                                total_functions += func_count
-                                # Rough estimate
-                                total_function_lines += len(lines) / func_count
-                    except Exception as e:
-                        pass
+                    # Check for type hints
+                    if '->' in content or ': ' in content:
+                        quality["files_with_type_hints"] += 1
+                    
+                    # Check file length
+                    if line_count > 500:
+                        item = (line_count, self._rel_path(file_path))
+                        if len(long_files_heap) < MAX_LONG_FILES:
+                            heapq.heappush(long_files_heap, item)
+                        else:
+                            heapq.heappushpop(long_files_heap, item)
+                    
+                    # Count functions and their lengths
+                    if tree is not None:
+                        for node in ast.walk(tree):
+                            if isinstance(node, _FUNCTION_NODES):
+                                total_functions += 1
+                                total_function_lines += node.end_lineno - node.lineno + 1
+                    else:
+                        func_count = len(_RE_DEF.findall(content))
+                        if func_count > 0:
+                            total_functions += func_count
+                            # Rough estimate
+                            total_function_lines += line_count / func_count
+                except Exception as e:
+                    pass
         
         if total_functions > 0:
             quality["avg_function_length"] = int(total_function_lines / total_functions)
         
-        # Sort long files by length
-        quality["long_files"] = sorted(quality["long_files"], key=lambda x: x[1], reverse=True)[:10]
-        
-        self.results["quality"] = quality
+        # Longest files first
+        quality["long_files"] = [(path, lines) for lines, path in sorted(long_files_heap, reverse=True)]
         
+        # Computed once here for the report, recommendations and health score; 0.0 without Python files
         total_py_files = quality["python_files_with_docstrings"] + quality["python_files_without_docstrings"]
+        quality["docstring_pct"] = 0.0
         if total_py_files > 0:
-            docstring_pct = (quality["python_files_with_docstrings"] / total_py_files) * 100
-            print(f"  ✓ Module docstrings: {quality['python_files_with_docstrings']}/{total_py_files} ({docstring_pct:.1f}%)")
+            quality["docstring_pct"] = (quality["python_files_with_docstrings"] / total_py_files) * 100
+            print(f"  ✓ Module docstrings: {quality['python_files_with_docstrings']}/{total_py_files} ({quality['docstring_pct']:.1f}%)")
+        
+        self.results["quality"] = quality
         
         print(f"  ✓ Files with type hints: {quality['files_with_type_hints']}")
         print(f"  ✓ Test files: {quality['test_files']}")
@@ -502,11 +835,9 @@ class CodeAnalyzer:
         """Generate overall summary"""
         print("📋 Generating Summary...\n")
         
-        from datetime import datetime
-        
         summary = {
             "repository": "VetrAI Platform",
-            "analysis_date": datetime.now().strftime('%Y-%m-%d'),
+            "analysis_date": date.today().isoformat(),
             "total_services": len(self.results.get("services", {})),
             "total_python_files": self.results["code_metrics"].get("python_files", 0),
             "total_code_lines": self.results["code_metrics"].get("code_lines", 0),
@@ -535,31 +866,31 @@ class CodeAnalyzer:
         
         # Security (25 points)
         sec = self.results.get("security", {})
+        sec_patterns = sec.get("security_patterns", {})
         if sec.get("env_example_found"):
             score += 5
         if sec.get("gitignore_found"):
             score += 5
         if sec.get("security_md_found"):
             score += 5
-        if sec.get("security_patterns", {}).get("jwt_usage"):
+        if sec_patterns.get("jwt_usage"):
             score += 5
-        if sec.get("security_patterns", {}).get("password_hashing"):
+        if sec_patterns.get("password_hashing"):
             score += 5
         
         # Services (25 points)
         services = self.results.get("services", {})
         if services:
-            services_with_docker = sum(1 for s in services.values() if s.get("has_dockerfile"))
-            services_with_reqs = sum(1 for s in services.values() if s.get("has_requirements"))
+            services_with_docker = services_with_reqs = 0
+            for service in services.values():
+                services_with_docker += bool(service.get("has_dockerfile"))
+                services_with_reqs += bool(service.get("has_requirements"))
             score += int((services_with_docker / len(services)) * 12.5)
             score += int((services_with_reqs / len(services)) * 12.5)
         
         # Code Quality (25 points)
         quality = self.results.get("quality", {})
-        total_py = quality.get("python_files_with_docstrings", 0) + quality.get("python_files_without_docstrings", 0)
-        if total_py > 0:
-            docstring_score = (quality.get("python_files_with_docstrings", 0) / total_py) * 10
-            score += docstring_score
+        score += quality.get("docstring_pct", 0.0) / 10
         
         if quality.get("test_files", 0) > 0:
             score += 10
@@ -573,40 +904,40 @@ class CodeAnalyzer:
         """Generate a markdown report"""
         print(f"📄 Generating Report: {output_file}")
         
-        report = []
-        report.append("# VetrAI Codebase Analysis Report\n")
-        report.append(f"**Generated:** {self.results['summary'].get('analysis_date', 'N/A')}\n")
-        report.append(f"**Health Score:** {self.results['summary'].get('health_score', 0)}/100\n")
-        report.append("---\n\n")
+        report = io.StringIO()
+        report.write("# VetrAI Codebase Analysis Report\n")
+        report.write(f"**Generated:** {self.results['summary'].get('analysis_date', 'N/A')}\n")
+        report.write(f"**Health Score:** {self.results['summary'].get('health_score', 0)}/100\n")
+        report.write("---\n\n")
         
         # Summary
-        report.append("## 📊 Summary\n")
+        report.write("## 📊 Summary\n")
         summary = self.results.get("summary", {})
-        report.append(f"- **Total Services:** {summary.get('total_services', 0)}\n")
-        report.append(f"- **Python Files:** {summary.get('total_python_files', 0)}\n")
-        report.append(f"- **Lines of Code:** {summary.get('total_code_lines', 0):,}\n")
-        report.append(f"- **Documentation Files:** {summary.get('documentation_files', 0)}\n\n")
+        report.write(f"- **Total Services:** {summary.get('total_services', 0)}\n")
+        report.write(f"- **Python Files:** {summary.get('total_python_files', 0)}\n")
+        report.write(f"- **Lines of Code:** {summary.get('total_code_lines', 0):,}\n")
+        report.write(f"- **Documentation Files:** {summary.get('documentation_files', 0)}\n\n")
         
         # Code Metrics
-        report.append("## 📈 Code Metrics\n")
+        report.write("## 📈 Code Metrics\n")
         metrics = self.results.get("code_metrics", {})
-        report.append(f"- Total Files: {metrics.get('total_files', 0)}\n")
-        report.append(f"- Python Files: {metrics.get('python_files', 0)}\n")
-        report.append(f"- JavaScript/TypeScript Files: {metrics.get('javascript_files', 0)}\n")
-        report.append(f"- Markdown Files: {metrics.get('markdown_files', 0)}\n")
-        report.append(f"- YAML Files: {metrics.get('yaml_files', 0)}\n")
-        report.append(f"- Dockerfiles: {metrics.get('dockerfile_count', 0)}\n")
-        report.append(f"- Python Code Lines: {metrics.get('code_lines', 0):,}\n")
-        report.append(f"- Comment Lines: {metrics.get('comment_lines', 0):,}\n")
-        report.append(f"- Blank Lines: {metrics.get('blank_lines', 0):,}\n\n")
+        report.write(f"- Total Files: {metrics.get('total_files', 0)}\n")
+        report.write(f"- Python Files: {metrics.get('python_files', 0)}\n")
+        report.write(f"- JavaScript/TypeScript Files: {metrics.get('javascript_files', 0)}\n")
+        report.write(f"- Markdown Files: {metrics.get('markdown_files', 0)}\n")
+        report.write(f"- YAML Files: {metrics.get('yaml_files', 0)}\n")
+        report.write(f"- Dockerfiles: {metrics.get('dockerfile_count', 0)}\n")
+        report.write(f"- Python Code Lines: {metrics.get('code_lines', 0):,}\n")
+        report.write(f"- Comment Lines: {metrics.get('comment_lines', 0):,}\n")
+        report.write(f"- Blank Lines: {metrics.get('blank_lines', 0):,}\n\n")
         
         # Services
-        report.append("## 🏗️ Service Architecture\n")
+        report.write("## 🏗️ Service Architecture\n")
         services = self.results.get("services", {})
         if services:
-            report.append(f"Found **{len(services)}** microservices:\n\n")
-            report.append("| Service | Port | Endpoints | Models | Docker | Requirements | Tests |\n")
-            report.append("|---------|------|-----------|--------|--------|--------------|-------|\n")
+            report.write(f"Found **{len(services)}** microservices:\n\n")
+            report.write("| Service | Port | Endpoints | Models | Docker | Requirements | Tests |\n")
+            report.write("|---------|------|-----------|--------|--------|--------------|-------|\n")
             for name, info in services.items():
                 docker = "✓" if info.get("has_dockerfile") else "✗"
                 reqs = "✓" if info.get("has_requirements") else "✗"
@@ -614,85 +945,85 @@ class CodeAnalyzer:
                 port = info.get("port", "N/A")
                 endpoints = len(info.get("endpoints", []))
                 models = len(info.get("models", []))
-                report.append(f"| {name} | {port} | {endpoints} | {models} | {docker} | {reqs} | {tests} |\n")
-            report.append("\n")
+                report.write(f"| {name} | {port} | {endpoints} | {models} | {docker} | {reqs} | {tests} |\n")
+            report.write("\n")
             
             # Detailed endpoints for each service
-            report.append("### Service Endpoints\n")
+            report.write("### Service Endpoints\n")
             for name, info in services.items():
                 if info.get("endpoints"):
-                    report.append(f"\n**{name.capitalize()} Service**\n")
+                    report.write(f"\n**{name.capitalize()} Service**\n")
                     for endpoint in info["endpoints"]:
-                        report.append(f"- `{endpoint}`\n")
-            report.append("\n")
+                        report.write(f"- `{endpoint}`\n")
+            report.write("\n")
         
         # Dependencies
-        report.append("## 📦 Dependencies\n")
+        report.write("## 📦 Dependencies\n")
         deps = self.results.get("dependencies", {})
         common = deps.get("common_packages", {})
         if common:
-            top = sorted(common.items(), key=lambda x: x[1], reverse=True)[:15]
-            report.append("**Most Common Packages:**\n\n")
+            top = common.most_common(15)
+            report.write("**Most Common Packages:**\n\n")
             for pkg, count in top:
-                report.append(f"- `{pkg}` (used in {count} services)\n")
-            report.append("\n")
+                report.write(f"- `{pkg}` (used in {count} services)\n")
+            report.write("\n")
         
         # Documentation
-        report.append("## 📚 Documentation\n")
+        report.write("## 📚 Documentation\n")
         docs = self.results.get("documentation", {})
-        report.append(f"- Total Markdown Files: {len(docs.get('markdown_files', []))}\n")
-        report.append(f"- Total Documentation Lines: {docs.get('total_doc_lines', 0):,}\n")
-        report.append(f"- README.md: {'✓ Found' if docs.get('readme_found') else '✗ Missing'}\n")
-        report.append(f"- CONTRIBUTING.md: {'✓ Found' if docs.get('contributing_found') else '✗ Missing'}\n")
-        report.append(f"- API Documentation: {'✓ Found' if docs.get('api_docs') else '✗ Missing'}\n")
-        report.append(f"- Architecture Docs: {'✓ Found' if docs.get('architecture_docs') else '✗ Missing'}\n")
-        report.append(f"- Deployment Docs: {'✓ Found' if docs.get('deployment_docs') else '✗ Missing'}\n\n")
+        report.write(f"- Total Markdown Files: {len(docs.get('markdown_files', []))}\n")
+        report.write(f"- Total Documentation Lines: {docs.get('total_doc_lines', 0):,}\n")
+        report.write(f"- README.md: {'✓ Found' if docs.get('readme_found') else '✗ Missing'}\n")
+        report.write(f"- CONTRIBUTING.md: {'✓ Found' if docs.get('contributing_found') else '✗ Missing'}\n")
+        report.write(f"- API Documentation: {'✓ Found' if docs.get('api_docs') else '✗ Missing'}\n")
+        report.write(f"- Architecture Docs: {'✓ Found' if docs.get('architecture_docs') else '✗ Missing'}\n")
+        report.write(f"- Deployment Docs: {'✓ Found' if docs.get('deployment_docs') else '✗ Missing'}\n\n")
         
         # Security
-        report.append("## 🔒 Security Analysis\n")
+        report.write("## 🔒 Security Analysis\n")
         sec = self.results.get("security", {})
-        report.append("**Security Files:**\n")
-        report.append(f"- .env.example: {'✓' if sec.get('env_example_found') else '✗'}\n")
-        report.append(f"- .gitignore: {'✓' if sec.get('gitignore_found') else '✗'}\n")
-        report.append(f"- SECURITY.md: {'✓' if sec.get('security_md_found') else '✗'}\n")
-        report.append(f"- .dockerignore: {'✓' if sec.get('dockerignore_found') else '✗'}\n\n")
+        report.write("**Security Files:**\n")
+        report.write(f"- .env.example: {'✓' if sec.get('env_example_found') else '✗'}\n")
+        report.write(f"- .gitignore: {'✓' if sec.get('gitignore_found') else '✗'}\n")
+        report.write(f"- SECURITY.md: {'✓' if sec.get('security_md_found') else '✗'}\n")
+        report.write(f"- .dockerignore: {'✓' if sec.get('dockerignore_found') else '✗'}\n\n")
         
         patterns = sec.get("security_patterns", {})
-        report.append("**Security Patterns:**\n")
-        report.append(f"- JWT Authentication: {'✓ Detected' if patterns.get('jwt_usage') else '✗ Not detected'}\n")
-        report.append(f"- Password Hashing: {'✓ Detected' if patterns.get('password_hashing') else '✗ Not detected'}\n\n")
+        report.write("**Security Patterns:**\n")
+        report.write(f"- JWT Authentication: {'✓ Detected' if patterns.get('jwt_usage') else '✗ Not detected'}\n")
+        report.write(f"- Password Hashing: {'✓ Detected' if patterns.get('password_hashing') else '✗ Not detected'}\n\n")
         
         if sec.get("secrets_in_code"):
-            report.append(f"⚠️ **Warning:** Potential hardcoded secrets found in {len(sec['secrets_in_code'])} files\n\n")
+            report.write(f"⚠️ **Warning:** Potential hardcoded secrets found in {len(sec['secrets_in_code'])} files\n\n")
         
         # Code Quality
-        report.append("## ✨ Code Quality\n")
+        report.write("## ✨ Code Quality\n")
         quality = self.results.get("quality", {})
-        total_py = quality.get("python_files_with_docstrings", 0) + quality.get("python_files_without_docstrings", 0)
+        with_docstrings = quality.get("python_files_with_docstrings", 0)
+        total_py = with_docstrings + quality.get("python_files_without_docstrings", 0)
         if total_py > 0:
-            pct = (quality.get("python_files_with_docstrings", 0) / total_py) * 100
-            report.append(f"- Files with Docstrings: {quality.get('python_files_with_docstrings', 0)}/{total_py} ({pct:.1f}%)\n")
-        report.append(f"- Files with Type Hints: {quality.get('files_with_type_hints', 0)}\n")
-        report.append(f"- Test Files: {quality.get('test_files', 0)}\n")
-        report.append(f"- Average Function Length: ~{quality.get('avg_function_length', 0)} lines\n\n")
+            report.write(f"- Files with Docstrings: {with_docstrings}/{total_py} ({quality.get('docstring_pct', 0.0):.1f}%)\n")
+        report.write(f"- Files with Type Hints: {quality.get('files_with_type_hints', 0)}\n")
+        report.write(f"- Test Files: {quality.get('test_files', 0)}\n")
+        report.write(f"- Average Function Length: ~{quality.get('avg_function_length', 0)} lines\n\n")
         
         if quality.get("long_files"):
-            report.append("**Long Files (>500 lines):**\n")
+            report.write("**Long Files (>500 lines):**\n")
             for file_path, lines in quality["long_files"][:5]:
-                report.append(f"- `{file_path}` ({lines} lines)\n")
-            report.append("\n")
+                report.write(f"- `{file_path}` ({lines} lines)\n")
+            report.write("\n")
         
         # Recommendations
-        report.append("## 💡 Recommendations\n")
+        report.write("## 💡 Recommendations\n")
         recommendations = self._generate_recommendations()
         for rec in recommendations:
-            report.append(f"- {rec}\n")
-        report.append("\n")
+            report.write(f"- {rec}\n")
+        report.write("\n")
         
         # Save report
-        output_path = self.repo_path / output_file
+        output_path = self.repo_path.joinpath(output_file)
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(''.join(report))
+            f.write(report.getvalue())
         
         print(f"  ✓ Report saved to: {output_path}\n")
     
@@ -720,13 +1051,17 @@ class CodeAnalyzer:
         
         # Service recommendations
         services = self.results.get("services", {})
-        services_without_docker = [name for name, info in services.items() 
-                                  if not info.get("has_dockerfile")]
+        services_without_docker = []
+        services_without_tests = []
+        for name, info in services.items():
+            if not info.get("has_dockerfile"):
+                services_without_docker.append(name)
+            if not info.get("has_tests"):
+                services_without_tests.append(name)
+        
         if services_without_docker:
             recommendations.append(f"Add Dockerfiles to services: {', '.join(services_without_docker)}")
         
-        services_without_tests = [name for name, info in services.items() 
-                                 if not info.get("has_tests")]
         if services_without_tests:
             recommendations.append(f"Add tests to services: {', '.join(services_without_tests)}")
         
@@ -735,11 +1070,8 @@ class CodeAnalyzer:
         if quality.get("test_files", 0) < 5:
             recommendations.append("Increase test coverage - add more unit and integration tests")
         
-        total_py = quality.get("python_files_with_docstrings", 0) + quality.get("python_files_without_docstrings", 0)
-        if total_py > 0:
-            pct = (quality.get("python_files_with_docstrings", 0) / total_py) * 100
-            if pct < 50:
-                recommendations.append("Improve documentation - add docstrings to Python modules")
+        if quality.get("docstring_pct", 0.0) < 50:
+            recommendations.append("Improve documentation - add docstrings to Python modules")
         
         if not recommendations:
             recommendations.append("✓ Codebase is well-maintained! Keep up the good work.")
@@ -748,9 +1080,17 @@ class CodeAnalyzer:
     
     def save_json(self, output_file: str = "codebase_analysis.json"):
         """Save analysis results as JSON"""
-        output_path = self.repo_path / output_file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        output_path = self.repo_path.joinpath(output_file)
+        if ORJSON_AVAILABLE:
+            # orjson serializes in C straight to UTF-8 bytes, skipping the text encoding layer
+            data = orjson.dumps(self.results, default=str,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        else:
+            # Stream straight into a large buffer: no full-document string, few write syscalls
+            with open(output_path, 'w', encoding='utf-8', buffering=JSON_WRITE_BUFFER_SIZE) as f:
+                json.dump(self.results, f, indent=2, default=str)
         print(f"  ✓ JSON data saved to: {output_path}\n")
 
 
@@ -763,11 +1103,14 @@ def main():
     parser.add_argument('--output', default='CODEBASE_ANALYSIS.md', help='Output report filename')
     parser.add_argument('--json', action='store_true', help='Also save results as JSON')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Ignore and do not update the {CACHE_FILE_NAME} results cache')
     
     args = parser.parse_args()
     
     # Run analysis
-    analyzer = CodeAnalyzer(args.path)
+    analyzer = CodeAnalyzer(args.path, use_cache=not args.no_cache,
+                            output_files=(args.output, "codebase_analysis.json"))
     results = analyzer.analyze()
     
     # Generate reports
@@ -1,6 +1,6 @@
 
 # VetrAI Platform Integration Example
-import requests
+# requests is imported inside the API helpers so importing this module stays cheap
 
 # Configuration
 VETRAI_BASE_URL = "http://localhost:8001"  # Change to your production URL
@@ -8,6 +8,8 @@ API_TOKEN = None  # Will be set after authentication
 
 def authenticate(email, password):
     """Authenticate with VetrAI platform"""
+    import requests
+    
     response = requests.post(f"{VETRAI_BASE_URL}/api/v1/auth/login", 
                            data={"username": email, "password": password})
     if response.status_code == 200:
@@ -22,6 +24,8 @@ def get_headers():
 
 def create_tenant(org_name):
     """Create a new tenant organization"""
+    import requests
+    
     response = requests.post(f"http://localhost:8002/api/v1/tenants",
                            json={"name": org_name},
                            headers=get_headers())
@@ -0,0 +1,60 @@
+#!/bin/bash
+# VetrAI Platform - Production Deployment Helper
+# Run this script to deploy your platform to production
+
+echo "🚀 VetrAI Platform Production Deployment"
+echo "========================================"
+
+echo "📋 Checking prerequisites..."
+
+# Check Docker
+if ! command -v docker &> /dev/null; then
+    echo "❌ Docker is required. Please install Docker first."
+    exit 1
+fi
+
+# Check Docker Compose
+if ! command -v docker-compose &> /dev/null; then
+    echo "❌ Docker Compose is required. Please install Docker Compose first."
+    exit 1
+fi
+
+echo "✅ Prerequisites check passed"
+
+echo "🏗️ Choose deployment method:"
+echo "1. Local production deployment"
+echo "2. Cloud provider deployment"
+echo "3. Development environment setup"
+
+read -p "Enter your choice (1-3): " choice
+
+case $choice in
+    1)
+        echo "🔧 Setting up local production environment..."
+        cp .env.example .env.production
+        echo "📝 Please edit .env.production with your production settings"
+        echo "🚀 Run: docker-compose -f docker-compose.prod.yml up -d"
+        ;;
+    2)
+        echo "☁️ Cloud deployment options:"
+        echo "• AWS: Upload entire project to EC2 or use ECS"
+        echo "• Azure: Use Container Apps"
+        echo "• GCP: Use Cloud Run"
+        echo "• DigitalOcean: Use App Platform"
+        echo "📋 Use the files in /scripts/setup/ for automated deployment"
+        ;;
+    3)
+        echo "💻 Development environment setup..."
+        echo "✅ Your platform is already running in development mode!"
+        echo "🔗 Studio: http://localhost:3000"
+        echo "🔗 Admin: http://localhost:3001"
+        echo "🔗 APIs: http://localhost:8001-8008/docs"
+        ;;
+    *)
+        echo "❌ Invalid choice. Please run the script again."
+        ;;
+esac
+
+echo ""
+echo "✨ VetrAI Platform deployment helper complete!"
+echo "📚 Check the documentation in /docs for detailed guides"
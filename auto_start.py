@@ -4,11 +4,40 @@ VetrAI Platform - Automated Startup
 One-command platform startup with health verification
 """
 
-import subprocess
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
+
+from _vetrai_endpoints import BACKEND_PORTS, FRONTENDS, close_session, get_session
+
+# Healthy backend services needed before the platform counts as ready
+READY_THRESHOLD = 6
+
+def is_healthy(port):
+    """Return True if the service on the given port answers its health check"""
+    try:
+        response = get_session().get(f"http://localhost:{port}/health", timeout=3)
+        return response.status_code == 200
+    except:
+        return False
+
+def wait_for_services(ports, threshold, timeout=60):
+    """Poll health checks with exponential backoff until enough services are up or time runs out"""
+    deadline = time.monotonic() + timeout
+    delay = 0.5
+    # Create the session before the worker threads race to do it
+    get_session()
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        while True:
+            healthy_count = sum(executor.map(is_healthy, ports))
+            remaining = deadline - time.monotonic()
+            if healthy_count >= threshold or remaining <= 0:
+                return healthy_count
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 4.0)
 
 def main():
+    import subprocess
+    
     print("Starting VetrAI Platform...")
     
     # Start backend services
@@ -23,28 +52,17 @@ def main():
         print("[ERR] Failed to start backend services")
         return False
     
-    # Wait for services to be ready
+    # Wait for services to be ready, then verify them
     print("Waiting for services to be ready...")
-    time.sleep(30)
-    
-    # Verify services
-    services = [8001, 8002, 8003, 8004, 8005, 8006, 8007, 8008]
-    healthy_count = 0
-    
-    for port in services:
-        try:
-            response = requests.get(f"http://localhost:{port}/health", timeout=3)
-            if response.status_code == 200:
-                healthy_count += 1
-        except:
-            pass
+    services = BACKEND_PORTS
+    healthy_count = wait_for_services(services, READY_THRESHOLD)
     
     print(f"Health Check: {healthy_count}/{len(services)} services healthy")
     
-    if healthy_count >= 6:
+    if healthy_count >= READY_THRESHOLD:
         print("[OK] Platform is ready!")
-        print("Studio UI: http://localhost:3000")
-        print("Admin Dashboard: http://localhost:3001")
+        for port, name in FRONTENDS:
+            print(f"{name}: http://localhost:{port}")
         print("API Documentation: http://localhost:8008/docs")
         return True
     else:
@@ -52,4 +70,7 @@ def main():
         return False
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    finally:
+        close_session()
\ No newline at end of file
@@ -4,10 +4,68 @@ VetrAI Platform Frontend Status Check
 Validates that frontend applications are working correctly
 """
 
-import requests
 import time
 import sys
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from _vetrai_endpoints import BACKEND_SERVICES, FRONTENDS, get_session
+
+# This report's own names for frontends whose shared label differs
+FRONTEND_LABELS = {3000: "Studio Frontend"}
+
+# Status icons shared by every probe line
+OK, WARN, FAIL = "✅", "⚠️", "❌"
+
+# Probe statuses that count towards the healthy total
+HEALTHY_STATUSES = frozenset({"HEALTHY", "ACCESSIBLE"})
+
+# Frontend pages are identified from the start of the body only
+HEAD_BYTES = 4096
+
+def check_api_service(service: str, url: str) -> Tuple[str, Dict]:
+    """Probe a backend health endpoint, returning the status line and result"""
+    import requests
+    
+    try:
+        response = get_session().get(url, timeout=5)
+        if response.status_code == 200:
+            return (f"{OK} {service}: HEALTHY ({response.json().get('status', 'OK')})",
+                    {"service": service, "status": "HEALTHY", "url": url})
+        return (f"{WARN}  {service}: HTTP {response.status_code}",
+                {"service": service, "status": "WARNING", "url": url})
+    except requests.exceptions.RequestException as e:
+        return (f"{FAIL} {service}: CONNECTION FAILED",
+                {"service": service, "status": "FAILED", "url": url})
+
+def read_head(response, limit: int = HEAD_BYTES) -> bytes:
+    """Read up to the first limit bytes of a streamed response body"""
+    head = b""
+    for chunk in response.iter_content(limit):
+        head += chunk
+        if len(head) >= limit:
+            break
+    return head[:limit]
+
+def check_frontend_app(service: str, url: str) -> Tuple[str, Dict]:
+    """Probe a frontend application, returning the status line and result"""
+    import requests
+    
+    try:
+        # Stream the body: the page markers sit at the top, so the rest is never downloaded
+        with get_session().get(url, timeout=10, stream=True) as response:
+            if response.status_code == 200:
+                head = read_head(response)
+                if b"Next.js" in head or b"<!DOCTYPE html>" in head:
+                    return (f"{OK} {service}: ACCESSIBLE",
+                            {"service": service, "status": "ACCESSIBLE", "url": url})
+                return (f"{WARN}  {service}: UNEXPECTED RESPONSE",
+                        {"service": service, "status": "WARNING", "url": url})
+            return (f"{FAIL} {service}: HTTP {response.status_code}",
+                    {"service": service, "status": "FAILED", "url": url})
+    except requests.exceptions.RequestException as e:
+        return (f"{FAIL} {service}: CONNECTION FAILED",
+                {"service": service, "status": "FAILED", "url": url})
 
 def check_frontend_status():
     """Check the status of frontend applications"""
@@ -16,82 +74,54 @@ def check_frontend_status():
     print("=" * 60)
     
     # Frontend endpoints to check
-    endpoints = {
-        "Studio Frontend": "http://localhost:3000",
-        "Admin Dashboard": "http://localhost:3001",
-    }
+    endpoints = {FRONTEND_LABELS.get(port, name): f"http://localhost:{port}" for port, name in FRONTENDS}
     
     # Backend API endpoints
-    api_endpoints = {
-        "Auth Service": "http://localhost:8001/health",
-        "Tenancy Service": "http://localhost:8002/health", 
-        "Keys Service": "http://localhost:8003/health",
-        "Billing Service": "http://localhost:8004/health",
-        "Support Service": "http://localhost:8005/health",
-        "Themes Service": "http://localhost:8006/health",
-        "Notifications Service": "http://localhost:8007/health",
-        "Workers Service": "http://localhost:8008/health"
-    }
-    
-    results = []
+    api_endpoints = {f"{name} Service": f"http://localhost:{port}/health" for name, port in BACKEND_SERVICES}
     
-    # Check backend APIs first
-    print("\n🔧 Backend API Services:")
-    print("-" * 30)
-    for service, url in api_endpoints.items():
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                print(f"✅ {service}: HEALTHY ({response.json().get('status', 'OK')})")
-                results.append({"service": service, "status": "HEALTHY", "url": url})
-            else:
-                print(f"⚠️  {service}: HTTP {response.status_code}")
-                results.append({"service": service, "status": "WARNING", "url": url})
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {service}: CONNECTION FAILED")
-            results.append({"service": service, "status": "FAILED", "url": url})
+    healthy_count = 0
+    total_count = 0
+    failed_services = []
     
-    # Check frontend applications
-    print("\n🌐 Frontend Applications:")
-    print("-" * 30)
-    for service, url in endpoints.items():
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                if "Next.js" in response.text or "<!DOCTYPE html>" in response.text:
-                    print(f"✅ {service}: ACCESSIBLE")
-                    results.append({"service": service, "status": "ACCESSIBLE", "url": url})
-                else:
-                    print(f"⚠️  {service}: UNEXPECTED RESPONSE")
-                    results.append({"service": service, "status": "WARNING", "url": url})
-            else:
-                print(f"❌ {service}: HTTP {response.status_code}")
-                results.append({"service": service, "status": "FAILED", "url": url})
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {service}: CONNECTION FAILED")
-            results.append({"service": service, "status": "FAILED", "url": url})
+    # Probe everything concurrently; output is still printed in endpoint order.
+    # The session is created up front so the worker threads share one pool
+    get_session()
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        api_checks = executor.map(check_api_service, api_endpoints.keys(), api_endpoints.values())
+        frontend_checks = executor.map(check_frontend_app, endpoints.keys(), endpoints.values())
+        
+        # Backend APIs first, then frontend applications; tally outcomes as they print
+        sections = (("\n🔧 Backend API Services:", api_checks),
+                    ("\n🌐 Frontend Applications:", frontend_checks))
+        for title, checks in sections:
+            print(title)
+            print("-" * 30)
+            for message, result in checks:
+                print(message)
+                total_count += 1
+                status = result["status"]
+                if status in HEALTHY_STATUSES:
+                    healthy_count += 1
+                elif status == "FAILED":
+                    failed_services.append(result)
     
     # Summary
     print("\n📊 Platform Status Summary:")
     print("-" * 40)
     
-    healthy_count = len([r for r in results if r["status"] in ["HEALTHY", "ACCESSIBLE"]])
-    total_count = len(results)
-    
     if healthy_count == total_count:
         print("🟢 ALL SYSTEMS OPERATIONAL")
         print(f"   {healthy_count}/{total_count} services running correctly")
         print("\n🚀 Platform is ready for use:")
-        print("   • Studio Frontend: http://localhost:3000")
-        print("   • Admin Dashboard: http://localhost:3001")
+        for name, url in endpoints.items():
+            print(f"   • {name}: {url}")
         return True
     else:
         print(f"🟡 PARTIAL OPERATION")
         print(f"   {healthy_count}/{total_count} services healthy")
         
-        failed_services = [r for r in results if r["status"] == "FAILED"]
         if failed_services:
-            print("\n❌ Failed Services:")
+            print(f"\n{FAIL} Failed Services:")
             for service in failed_services:
                 print(f"   • {service['service']}")
         return False
@@ -4,48 +4,85 @@ Enhanced Health Check Script
 Provides detailed service health monitoring
 """
 
-import requests
+import asyncio
 import json
 import time
 from datetime import datetime
 
-def check_service_health():
-    services = {
-        "Auth": "http://localhost:8001/health",
-        "Tenancy": "http://localhost:8002/health",
-        "Keys": "http://localhost:8003/health",
-        "Billing": "http://localhost:8004/health",
-        "Support": "http://localhost:8005/health",
-        "Themes": "http://localhost:8006/health",
-        "Notifications": "http://localhost:8007/health",
-        "Workers": "http://localhost:8008/health"
-    }
-    
-    results = {}
-    
-    for name, url in services.items():
-        try:
-            start_time = time.time()
-            response = requests.get(url, timeout=5)
-            response_time = (time.time() - start_time) * 1000
+# Health endpoints probed on every run, built once at import
+from _vetrai_endpoints import HEALTH_ENDPOINTS as SERVICES
+from _vetrai_endpoints import get_session
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def probe_service_blocking(url):
+    """Probe a single health endpoint with requests, for when aiohttp is missing"""
+    try:
+        start_time = time.perf_counter()
+        response = get_session().get(url, timeout=5)
+        response_time = (time.perf_counter() - start_time) * 1000
+        
+        return {
+            "status": "healthy" if response.status_code == 200 else "unhealthy",
+            "response_code": response.status_code,
+            "response_time_ms": round(response_time, 2),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": str(e) or type(e).__name__,
+            "timestamp": datetime.now().isoformat()
+        }
+
+async def probe_service(session, url):
+    """Probe a single health endpoint"""
+    if session is None:
+        return await asyncio.to_thread(probe_service_blocking, url)
+    try:
+        start_time = time.perf_counter()
+        async with session.get(url) as response:
+            response_time = (time.perf_counter() - start_time) * 1000
             
-            results[name] = {
-                "status": "healthy" if response.status_code == 200 else "unhealthy",
-                "response_code": response.status_code,
+            return {
+                "status": "healthy" if response.status == 200 else "unhealthy",
+                "response_code": response.status,
                 "response_time_ms": round(response_time, 2),
                 "timestamp": datetime.now().isoformat()
             }
-        except Exception as e:
-            results[name] = {
-                "status": "error",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
+    except Exception as e:
+        return {
+            "status": "error",
+            # Timeouts carry no message, so fall back to the exception type
+            "error": str(e) or type(e).__name__,
+            "timestamp": datetime.now().isoformat()
+        }
+
+async def check_service_health():
+    # Probe all services concurrently on one event loop and one connection pool
+    if AIOHTTP_AVAILABLE:
+        timeout = aiohttp.ClientTimeout(total=5)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            probes = await asyncio.gather(*(probe_service(session, url) for name, url in SERVICES))
+    else:
+        # Without aiohttp the blocking requests probes share the default thread pool
+        get_session()
+        probes = await asyncio.gather(*(probe_service(None, url) for name, url in SERVICES))
     
-    return results
+    return {name: probe for (name, url), probe in zip(SERVICES, probes)}
 
 if __name__ == "__main__":
-    health_data = check_service_health()
+    health_data = asyncio.run(check_service_health())
     
     print("VetrAI Platform Health Report")
     print("=" * 40)
@@ -60,7 +97,11 @@ if __name__ == "__main__":
             print(f"   Response Time: {data['response_time_ms']}ms")
     
     # Save detailed report
-    with open("health_report.json", "w") as f:
-        json.dump(health_data, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open("health_report.json", "wb") as f:
+            f.write(orjson.dumps(health_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open("health_report.json", "w") as f:
+            json.dump(health_data, f, indent=2)
     
     print(f"\nDetailed report saved to: health_report.json")
@@ -4,13 +4,40 @@ VetrAI Frontend CSS Loading Fix
 Addresses common CSS loading issues in Next.js applications
 """
 
+import asyncio
 import subprocess
 import json
 import os
-import requests
+import shutil
+import stat
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
 
+from _vetrai_endpoints import FRONTENDS, get_session
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+FRONTEND_DIRS = ["frontend/studio", "frontend/admin"]
+
+# Threads unlinking cache files while clearing the Next.js caches
+RMTREE_WORKERS = 8
+
+# PowerShell pipeline selecting Node.js processes, used when psutil is missing
+NODE_PROCESSES_PS = 'Get-Process | Where-Object {$_.ProcessName -like "*node*"}'
+
 def print_header(title):
     print(f"\n{'='*50}")
     print(f"🎨 {title}")
@@ -20,15 +47,39 @@ def print_step(step, description):
     print(f"\n{step} {description}")
     print("-" * 40)
 
+def find_node_processes():
+    """Return running Node.js processes, read in-process through psutil"""
+    return [proc for proc in psutil.process_iter(['name', 'pid', 'create_time'])
+            if 'node' in (proc.info['name'] or '').lower()]
+
 def check_frontend_processes():
     """Check if frontend development servers are running"""
     print_step("🔍", "CHECKING FRONTEND PROCESSES")
     
+    if PSUTIL_AVAILABLE:
+        try:
+            node_processes = find_node_processes()
+        except psutil.Error as e:
+            print(f"❌ Error checking processes: {e}")
+            return False
+        
+        if node_processes:
+            print("✅ Node.js processes found:")
+            for proc in node_processes:
+                # psutil reports None for attributes it was denied access to
+                create_time = proc.info['create_time']
+                started = datetime.fromtimestamp(create_time).strftime('%Y-%m-%d %H:%M:%S') if create_time else "unknown"
+                print(f"   {proc.info['name']:<15} {proc.info['pid']:>7}  {started}")
+            return True
+        else:
+            print("❌ No Node.js processes found")
+            return False
+    
     try:
         # Check for Node.js processes
         result = subprocess.run([
             'powershell', '-Command', 
-            'Get-Process | Where-Object {$_.ProcessName -like "*node*"} | Select-Object ProcessName, Id, StartTime'
+            f'{NODE_PROCESSES_PS} | Select-Object ProcessName, Id, StartTime'
         ], capture_output=True, text=True)
         
         if result.returncode == 0 and result.stdout.strip():
@@ -42,29 +93,83 @@ def check_frontend_processes():
         print(f"❌ Error checking processes: {e}")
         return False
 
+def probe_port_blocking(port, timeout):
+    """Request a frontend root page with requests, for when aiohttp is missing"""
+    try:
+        response = get_session().get(f"http://localhost:{port}", timeout=timeout)
+        return response.status_code, None
+    except Exception as e:
+        return None, e
+
+async def probe_port(session, port, timeout):
+    """Request a frontend root page, returning (status_code, None) or (None, error)"""
+    if session is None:
+        return await asyncio.to_thread(probe_port_blocking, port, timeout)
+    try:
+        async with session.get(f"http://localhost:{port}", timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            return response.status, None
+    except Exception as e:
+        return None, e
+
+@asynccontextmanager
+async def probe_session():
+    """Yield one aiohttp session, or None so probes run requests on the default thread pool"""
+    if not AIOHTTP_AVAILABLE:
+        get_session()
+        yield None
+        return
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+def is_connection_refused(error):
+    """Whether a probe error means nothing is listening on the port"""
+    if AIOHTTP_AVAILABLE:
+        return isinstance(error, aiohttp.ClientConnectorError)
+    import requests
+    return isinstance(error, requests.ConnectionError)
+
+async def probe_ports(ports):
+    """Probe all ports concurrently over one connection pool"""
+    async with probe_session() as session:
+        return await asyncio.gather(*(probe_port(session, port, 5) for port in ports))
+
+async def wait_for_ports(ports, timeout=30):
+    """Poll ports with exponential backoff until they all answer or time runs out"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.5
+    async with probe_session() as session:
+        while True:
+            outcomes = await asyncio.gather(*(probe_port(session, port, 2) for port in ports))
+            ready_count = sum(status == 200 for status, error in outcomes)
+            remaining = deadline - loop.time()
+            if ready_count == len(ports) or remaining <= 0:
+                return ready_count
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 4.0)
+
 def check_frontend_ports():
     """Check if frontend ports are responding"""
     print_step("🌐", "TESTING FRONTEND PORTS")
     
-    ports = {
-        3000: "Studio UI",
-        3001: "Admin Dashboard"
-    }
+    ports = dict(FRONTENDS)
     
     working_ports = []
     
-    for port, name in ports.items():
-        try:
-            response = requests.get(f"http://localhost:{port}", timeout=5)
-            if response.status_code == 200:
+    # All ports are probed at once; results are reported in port order
+    outcomes = asyncio.run(probe_ports(ports))
+    for (port, name), (status, error) in zip(ports.items(), outcomes):
+        if error is None:
+            if status == 200:
                 print(f"✅ {name} (:{port}): OK")
                 working_ports.append(port)
             else:
-                print(f"⚠️ {name} (:{port}): Status {response.status_code}")
-        except requests.ConnectionError:
+                print(f"⚠️ {name} (:{port}): Status {status}")
+        elif is_connection_refused(error):
             print(f"❌ {name} (:{port}): Connection refused")
-        except Exception as e:
-            print(f"❌ {name} (:{port}): {e}")
+        else:
+            # Timeouts carry no message, so fall back to the exception type
+            print(f"❌ {name} (:{port}): {str(error) or type(error).__name__}")
     
     return working_ports
 
@@ -73,133 +178,157 @@ def restart_frontend_dev_servers():
     print_step("🔄", "RESTARTING FRONTEND SERVERS")
     
     # Kill existing Node.js processes
-    try:
-        subprocess.run([
-            'powershell', '-Command', 
-            'Get-Process | Where-Object {$_.ProcessName -like "*node*"} | Stop-Process -Force'
-        ], capture_output=True)
-        print("✅ Stopped existing Node.js processes")
-    except Exception as e:
-        print(f"⚠️ Error stopping processes: {e}")
+    if PSUTIL_AVAILABLE:
+        try:
+            node_processes = find_node_processes()
+            for proc in node_processes:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            # Returns as soon as they have all exited instead of always sleeping
+            psutil.wait_procs(node_processes, timeout=2)
+            print("✅ Stopped existing Node.js processes")
+        except psutil.Error as e:
+            print(f"⚠️ Error stopping processes: {e}")
+    else:
+        try:
+            # Same selection as check_frontend_processes, so every process it lists is stopped
+            subprocess.run(['powershell', '-Command', f'{NODE_PROCESSES_PS} | Stop-Process -Force'],
+                           capture_output=True)
+            print("✅ Stopped existing Node.js processes")
+        except Exception as e:
+            print(f"⚠️ Error stopping processes: {e}")
+        
+        time.sleep(2)
     
-    time.sleep(2)
+    # Launch npm directly in each app dir: no shell to start and no path quoting to get wrong
+    npm_exe = shutil.which('npm.cmd') or shutil.which('npm') or 'npm'
+    new_console = getattr(subprocess, 'CREATE_NEW_CONSOLE', 0)
     
-    # Start Studio UI
-    try:
-        studio_path = Path("frontend/studio")
-        if studio_path.exists():
-            print("🚀 Starting Studio UI...")
-            subprocess.Popen([
-                'powershell', '-Command', 
-                f'cd {studio_path}; npm run dev'
-            ], creationflags=subprocess.CREATE_NEW_CONSOLE)
-        else:
-            print("❌ Studio UI path not found")
-    except Exception as e:
-        print(f"❌ Failed to start Studio UI: {e}")
+    for name, frontend_path in (("Studio UI", Path("frontend/studio")),
+                                ("Admin Dashboard", Path("frontend/admin"))):
+        try:
+            if frontend_path.exists():
+                print(f"🚀 Starting {name}...")
+                subprocess.Popen([npm_exe, 'run', 'dev'], cwd=str(frontend_path),
+                                 creationflags=new_console, close_fds=True)
+            else:
+                print(f"❌ {name} path not found")
+        except Exception as e:
+            print(f"❌ Failed to start {name}: {e}")
     
-    # Start Admin Dashboard  
+    print("⏳ Waiting for servers to start...")
+    asyncio.run(wait_for_ports([port for port, name in FRONTENDS]))
+
+def read_bytes_if_exists(path):
+    """Return a file's raw bytes, or None if it does not exist (one open instead of exists + open)"""
     try:
-        admin_path = Path("frontend/admin")
-        if admin_path.exists():
-            print("🚀 Starting Admin Dashboard...")
-            subprocess.Popen([
-                'powershell', '-Command', 
-                f'cd {admin_path}; npm run dev'
-            ], creationflags=subprocess.CREATE_NEW_CONSOLE)
-        else:
-            print("❌ Admin Dashboard path not found")
-    except Exception as e:
-        print(f"❌ Failed to start Admin Dashboard: {e}")
-    
-    print("⏳ Waiting 10 seconds for servers to start...")
-    time.sleep(10)
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+def scan_frontends():
+    """Check each frontend dir and read the files the fix steps inspect, once per run"""
+    frontends = {}
+    for frontend_dir in FRONTEND_DIRS:
+        root = Path(frontend_dir)
+        app_file = root / "src" / "pages" / "_app.tsx"
+        frontends[frontend_dir] = {
+            "exists": root.is_dir(),
+            "app_file": app_file,
+            "app_content": read_bytes_if_exists(app_file),
+            "tailwind_config": read_bytes_if_exists(root / "tailwind.config.js")
+        }
+    return frontends
+
+def remove_file(path):
+    """Delete a file, clearing its read-only bit first if needed, as Remove-Item -Force did"""
+    try:
+        os.unlink(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        os.unlink(path)
 
-def clear_next_cache():
+def fast_rmtree(root, executor):
+    """Delete a directory tree, unlinking each directory's files in parallel on executor"""
+    # .next holds thousands of tiny chunks: overlapping the unlink calls beats one-at-a-time rmtree
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        list(executor.map(remove_file, [os.path.join(dirpath, name) for name in filenames]))
+        for name in dirnames:
+            path = os.path.join(dirpath, name)
+            # os.walk lists symlinked dirs without descending; remove the link, not the target
+            if os.path.islink(path):
+                os.unlink(path)
+            else:
+                os.rmdir(path)
+    os.rmdir(root)
+
+def clear_next_cache(frontends):
     """Clear Next.js cache and build artifacts"""
     print_step("🧹", "CLEARING NEXT.JS CACHE")
     
-    frontend_dirs = ["frontend/studio", "frontend/admin"]
+    cache_dirs = []
     
-    for frontend_dir in frontend_dirs:
-        if Path(frontend_dir).exists():
+    for frontend_dir, frontend in frontends.items():
+        if frontend["exists"]:
             print(f"🧹 Clearing cache for {frontend_dir}...")
             
-            # Clear .next directory
-            next_dir = Path(frontend_dir) / ".next"
-            if next_dir.exists():
-                try:
-                    subprocess.run([
-                        'powershell', '-Command', 
-                        f'Remove-Item -Recurse -Force "{next_dir}"'
-                    ], check=True)
-                    print(f"  ✅ Cleared .next cache")
-                except Exception as e:
-                    print(f"  ⚠️ Error clearing .next: {e}")
-            
-            # Clear node_modules/.cache
-            cache_dir = Path(frontend_dir) / "node_modules" / ".cache"
-            if cache_dir.exists():
-                try:
-                    subprocess.run([
-                        'powershell', '-Command', 
-                        f'Remove-Item -Recurse -Force "{cache_dir}"'
-                    ], check=True)
-                    print(f"  ✅ Cleared node_modules cache")
-                except Exception as e:
-                    print(f"  ⚠️ Error clearing node cache: {e}")
+            # .next build output and node_modules/.cache
+            for label, cache_dir in ((".next cache", Path(frontend_dir) / ".next"),
+                                     ("node_modules cache", Path(frontend_dir) / "node_modules" / ".cache")):
+                if cache_dir.exists():
+                    cache_dirs.append((frontend_dir, label, cache_dir))
+    
+    if not cache_dirs:
+        return
+    
+    # One pool for every unlink: the trees are cleared one after another, each
+    # with its files deleted in parallel, so thread count stays at RMTREE_WORKERS
+    with ThreadPoolExecutor(max_workers=RMTREE_WORKERS) as executor:
+        for frontend_dir, label, cache_dir in cache_dirs:
+            try:
+                fast_rmtree(cache_dir, executor)
+                print(f"  ✅ Cleared {label} ({frontend_dir})")
+            except Exception as e:
+                print(f"  ⚠️ Error clearing {label} ({frontend_dir}): {e}")
 
-def fix_css_imports():
+def fix_css_imports(frontends):
     """Fix common CSS import issues"""
     print_step("🔧", "FIXING CSS IMPORTS")
     
-    frontend_dirs = ["frontend/studio", "frontend/admin"]
-    
-    for frontend_dir in frontend_dirs:
-        app_file = Path(frontend_dir) / "src" / "pages" / "_app.tsx"
+    for frontend_dir, frontend in frontends.items():
+        app_file = frontend["app_file"]
+        content = frontend["app_content"]
         
-        if app_file.exists():
+        if content is not None:
             print(f"🔍 Checking {app_file}")
             
-            with open(app_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check if globals.css import exists and is correct
-            if '@/styles/globals.css' in content:
+            # Check if globals.css import exists; a bytes search needs no UTF-8 decode
+            if b'@/styles/globals.css' in content:
                 print(f"  ✅ CSS import found in {frontend_dir}")
             else:
                 print(f"  ⚠️ CSS import might be missing in {frontend_dir}")
                 
-                # Add CSS import if missing
-                if "import '@/styles/globals.css'" not in content:
-                    lines = content.split('\n')
-                    # Insert CSS import at the beginning
-                    lines.insert(0, "import '@/styles/globals.css';")
-                    
-                    try:
-                        with open(app_file, 'w', encoding='utf-8') as f:
-                            f.write('\n'.join(lines))
-                        print(f"  ✅ Added CSS import to {frontend_dir}")
-                    except Exception as e:
-                        print(f"  ❌ Failed to fix CSS import: {e}")
-
-def check_tailwind_config():
+                # Insert CSS import at the beginning, leaving the rest of the file byte-for-byte intact
+                try:
+                    app_file.write_bytes(b"import '@/styles/globals.css';\n" + content)
+                    print(f"  ✅ Added CSS import to {frontend_dir}")
+                except Exception as e:
+                    print(f"  ❌ Failed to fix CSS import: {e}")
+
+def check_tailwind_config(frontends):
     """Verify Tailwind CSS configuration"""
     print_step("🎯", "CHECKING TAILWIND CONFIG")
     
-    frontend_dirs = ["frontend/studio", "frontend/admin"]
-    
-    for frontend_dir in frontend_dirs:
-        tailwind_config = Path(frontend_dir) / "tailwind.config.js"
+    for frontend_dir, frontend in frontends.items():
+        config_content = frontend["tailwind_config"]
         
-        if tailwind_config.exists():
+        if config_content is not None:
             print(f"✅ Tailwind config found: {frontend_dir}")
             
             # Check if content paths are correct
-            with open(tailwind_config, 'r', encoding='utf-8') as f:
-                config_content = f.read()
-            
-            if './src/' in config_content:
+            if b'./src/' in config_content:
                 print(f"  ✅ Tailwind content paths look correct")
             else:
                 print(f"  ⚠️ Tailwind content paths might need fixing")
@@ -259,10 +388,11 @@ def main():
     else:
         print("\n🔧 Applying fixes...")
         
-        # Apply fixes
-        clear_next_cache()
-        fix_css_imports()
-        check_tailwind_config()
+        # Apply fixes; the frontend dirs are checked and read once for all steps
+        frontends = scan_frontends()
+        clear_next_cache(frontends)
+        fix_css_imports(frontends)
+        check_tailwind_config(frontends)
         
         # Restart servers if needed
         if not processes_running or len(working_ports) < 2:
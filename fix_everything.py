@@ -4,13 +4,33 @@ VetrAI Platform - Universal Fix Script
 Addresses all identified issues across the platform
 """
 
-import subprocess
+import asyncio
 import os
+import re
 import json
-import requests
+import shutil
 import time
 from pathlib import Path
 
+from _vetrai_endpoints import FRONTENDS, get_session
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+FRONTEND_DIRS = ["frontend/studio", "frontend/admin"]
+
+# Checked-in helper scripts are installed from here
+SCRIPT_DIR = Path(__file__).resolve().parent
+
 def print_header(title):
     print(f"\n{'='*60}")
     print(f"🔧 {title}")
@@ -20,47 +40,55 @@ def print_step(step, description):
     print(f"\n{step} {description}")
     print("-" * 50)
 
-def fix_frontend_dependencies():
+async def run_command(*args, cwd=None):
+    """Run a command without blocking the event loop, returning (returncode, stdout)"""
+    process = await asyncio.create_subprocess_exec(
+        *args, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await process.communicate()
+    return process.returncode, stdout.decode(errors='replace')
+
+async def install_frontend_dependencies(frontend_dir):
+    """Install a frontend's dependencies and type definitions in one npm run"""
+    npm_exe = shutil.which('npm.cmd') or shutil.which('npm') or 'npm'
+    # Naming the @types packages in the same install resolves the dependency tree once, not twice
+    return await run_command(
+        npm_exe, 'install', '--legacy-peer-deps', '--save-dev',
+        '@types/node', '@types/react', '@types/react-dom',
+        cwd=frontend_dir
+    )
+
+async def fix_frontend_dependencies(frontend_dirs):
     """Fix frontend dependency and TypeScript issues"""
-    print_step("🔨", "FIXING FRONTEND DEPENDENCIES")
-    
-    frontend_dirs = ["frontend/studio", "frontend/admin"]
+    # The apps have separate node_modules, so both installs can run at once
+    installs = await asyncio.gather(
+        *(install_frontend_dependencies(d) for d in frontend_dirs), return_exceptions=True
+    )
     
-    for frontend_dir in frontend_dirs:
-        if Path(frontend_dir).exists():
-            print(f"🔧 Fixing {frontend_dir}...")
+    # Report only once the installs finish so this block is not interleaved with other steps
+    print_step("🔨", "FIXING FRONTEND DEPENDENCIES")
+    for frontend_dir, install in zip(frontend_dirs, installs):
+        print(f"🔧 Fixing {frontend_dir}...")
+        
+        try:
+            if isinstance(install, Exception):
+                raise install
             
-            try:
-                # Install missing dependencies
-                subprocess.run([
-                    'powershell', '-Command', 
-                    f'cd {frontend_dir}; npm install --legacy-peer-deps'
-                ], check=False, capture_output=True)
-                
-                # Fix TypeScript configuration
-                tsconfig_path = Path(frontend_dir) / "tsconfig.json"
-                if tsconfig_path.exists():
-                    print(f"  ✅ TypeScript config exists")
-                
-                # Install missing type definitions
-                subprocess.run([
-                    'powershell', '-Command', 
-                    f'cd {frontend_dir}; npm install @types/node @types/react @types/react-dom --save-dev'
-                ], check=False, capture_output=True)
-                
-                print(f"  ✅ Fixed dependencies for {frontend_dir}")
-                
-            except Exception as e:
-                print(f"  ⚠️ Error fixing {frontend_dir}: {e}")
+            # Fix TypeScript configuration
+            tsconfig_path = Path(frontend_dir) / "tsconfig.json"
+            if tsconfig_path.exists():
+                print(f"  ✅ TypeScript config exists")
+            
+            print(f"  ✅ Fixed dependencies for {frontend_dir}")
+            
+        except Exception as e:
+            print(f"  ⚠️ Error fixing {frontend_dir}: {e}")
 
-def fix_docker_security_issues():
+def fix_docker_security_issues(frontend_dirs):
     """Fix Docker security vulnerabilities"""
     print_step("🛡️", "FIXING DOCKER SECURITY ISSUES")
     
-    dockerfiles = [
-        "frontend/studio/Dockerfile",
-        "frontend/admin/Dockerfile"
-    ]
+    dockerfiles = [f"{frontend_dir}/Dockerfile" for frontend_dir in frontend_dirs]
     
     for dockerfile_path in dockerfiles:
         if Path(dockerfile_path).exists():
@@ -91,25 +119,26 @@ def fix_docker_security_issues():
             except Exception as e:
                 print(f"  ⚠️ Error updating {dockerfile_path}: {e}")
 
-def fix_minio_access():
+async def fix_minio_access():
     """Fix MinIO access issues"""
-    print_step("💾", "FIXING MINIO ACCESS")
-    
     try:
         # Check if MinIO container is running
-        result = subprocess.run([
+        returncode, _ = await run_command(
             'docker', 'exec', 'vetrai_v5-minio-1', 
             'mc', 'alias', 'set', 'local', 'http://localhost:9000', 
             'minioadmin', 'minioadmin'
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("  ✅ MinIO access configured")
-        else:
-            print("  ⚠️ MinIO might need manual configuration")
-            
+        )
+        error = None
     except Exception as e:
-        print(f"  ⚠️ MinIO fix error: {e}")
+        returncode, error = None, e
+    
+    print_step("💾", "FIXING MINIO ACCESS")
+    if error is not None:
+        print(f"  ⚠️ MinIO fix error: {error}")
+    elif returncode == 0:
+        print("  ✅ MinIO access configured")
+    else:
+        print("  ⚠️ MinIO might need manual configuration")
 
 def fix_css_linting():
     """Fix CSS linting issues for Tailwind"""
@@ -128,15 +157,23 @@ def fix_css_linting():
     settings_file = vscode_dir / "settings.json"
     
     try:
-        if settings_file.exists():
-            with open(settings_file, 'r') as f:
-                existing_settings = json.load(f)
-            existing_settings.update(vscode_settings)
-        else:
-            existing_settings = vscode_settings
+        try:
+            raw_settings = settings_file.read_bytes()
+            existing_settings = orjson.loads(raw_settings) if ORJSON_AVAILABLE else json.loads(raw_settings)
+        except FileNotFoundError:
+            existing_settings = {}
         
-        with open(settings_file, 'w') as f:
-            json.dump(existing_settings, f, indent=2)
+        # Re-running is the common case: leave the file alone when nothing would change
+        if all(existing_settings.get(key) == value for key, value in vscode_settings.items()):
+            print("  ✅ CSS linting already configured")
+            return
+        
+        existing_settings.update(vscode_settings)
+        if ORJSON_AVAILABLE:
+            settings_file.write_bytes(orjson.dumps(existing_settings, option=orjson.OPT_INDENT_2))
+        else:
+            with open(settings_file, 'w') as f:
+                json.dump(existing_settings, f, indent=2)
         
         print("  ✅ Fixed CSS linting configuration")
         
@@ -156,202 +193,122 @@ def optimize_docker_compose():
                 content = f.read()
             
             # Remove version line to eliminate warnings
-            lines = content.split('\n')
-            updated_lines = [line for line in lines if not line.startswith('version:')]
+            updated_content = re.sub(r'(?m)^version:.*\n?', '', content)
             
             with open(backend_compose, 'w') as f:
-                f.write('\n'.join(updated_lines))
+                f.write(updated_content)
             
             print("  ✅ Removed obsolete version from Docker Compose")
             
         except Exception as e:
             print(f"  ⚠️ Error optimizing Docker Compose: {e}")
 
+def install_script(name):
+    """Copy a checked-in helper script, and the endpoint tables it imports, into the working directory"""
+    copied = False
+    for filename in (name, "_vetrai_endpoints.py"):
+        source, target = SCRIPT_DIR / filename, Path(filename)
+        # Run from the repository root the scripts are already in place
+        if target.resolve() != source:
+            shutil.copyfile(source, target)
+            copied = True
+    return copied
+
 def create_healthcheck_improvements():
     """Create improved health checks"""
     print_step("❤️", "CREATING IMPROVED HEALTH CHECKS")
     
-    healthcheck_script = """#!/usr/bin/env python3
-\"\"\"
-Enhanced Health Check Script
-Provides detailed service health monitoring
-\"\"\"
-
-import requests
-import json
-import time
-from datetime import datetime
-
-def check_service_health():
-    services = {
-        "Auth": "http://localhost:8001/health",
-        "Tenancy": "http://localhost:8002/health",
-        "Keys": "http://localhost:8003/health",
-        "Billing": "http://localhost:8004/health",
-        "Support": "http://localhost:8005/health",
-        "Themes": "http://localhost:8006/health",
-        "Notifications": "http://localhost:8007/health",
-        "Workers": "http://localhost:8008/health"
-    }
-    
-    results = {}
-    
-    for name, url in services.items():
-        try:
-            start_time = time.time()
-            response = requests.get(url, timeout=5)
-            response_time = (time.time() - start_time) * 1000
-            
-            results[name] = {
-                "status": "healthy" if response.status_code == 200 else "unhealthy",
-                "response_code": response.status_code,
-                "response_time_ms": round(response_time, 2),
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            results[name] = {
-                "status": "error",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
-    
-    return results
-
-if __name__ == "__main__":
-    health_data = check_service_health()
-    
-    print("VetrAI Platform Health Report")
-    print("=" * 40)
-    print(f"Timestamp: {datetime.now()}")
-    print()
-    
-    for service, data in health_data.items():
-        status_icon = "✅" if data.get("status") == "healthy" else "❌"
-        print(f"{status_icon} {service}: {data.get('status', 'unknown')}")
-        
-        if "response_time_ms" in data:
-            print(f"   Response Time: {data['response_time_ms']}ms")
-    
-    # Save detailed report
-    with open("health_report.json", "w") as f:
-        json.dump(health_data, f, indent=2)
-    
-    print(f"\\nDetailed report saved to: health_report.json")
-"""
-
-    with open("enhanced_health_check.py", "w") as f:
-        f.write(healthcheck_script)
-    
-    print("  ✅ Created enhanced health check script")
+    # The checked-in script is the single source, so a run never reverts it
+    if install_script("enhanced_health_check.py"):
+        print("  ✅ Installed enhanced health check script")
+    else:
+        print("  ✓ Enhanced health check script already in place")
 
 def create_startup_automation():
     """Create automated startup script"""
     print_step("🚀", "CREATING STARTUP AUTOMATION")
     
-    startup_script = """#!/usr/bin/env python3
-\"\"\"
-VetrAI Platform - Automated Startup
-One-command platform startup with health verification
-\"\"\"
+    if install_script("auto_start.py"):
+        print("  ✅ Installed automated startup script")
+    else:
+        print("  ✓ Automated startup script already in place")
 
-import subprocess
-import time
-import requests
+def fetch_status_blocking(url, timeout):
+    """GET a URL with requests, for when aiohttp is missing"""
+    try:
+        return get_session().get(url, timeout=timeout).status_code
+    except Exception:
+        return None
 
-def main():
-    print("🚀 Starting VetrAI Platform...")
-    
-    # Start backend services
-    print("📦 Starting backend services...")
-    result = subprocess.run([
-        'docker-compose', '-f', 'docker-compose.backend.yml', 'up', '-d'
-    ], capture_output=True)
-    
-    if result.returncode == 0:
-        print("✅ Backend services started")
-    else:
-        print("❌ Failed to start backend services")
-        return False
-    
-    # Wait for services to be ready
-    print("⏳ Waiting for services to be ready...")
-    time.sleep(30)
-    
-    # Verify services
-    services = [8001, 8002, 8003, 8004, 8005, 8006, 8007, 8008]
-    healthy_count = 0
-    
-    for port in services:
-        try:
-            response = requests.get(f"http://localhost:{port}/health", timeout=3)
-            if response.status_code == 200:
-                healthy_count += 1
-        except:
-            pass
-    
-    print(f"📊 {healthy_count}/{len(services)} services healthy")
-    
-    if healthy_count >= 6:
-        print("🎉 Platform is ready!")
-        print("🔗 Studio UI: http://localhost:3000")
-        print("🔗 Admin Dashboard: http://localhost:3001")
-        print("🔗 API Documentation: http://localhost:8008/docs")
-        return True
-    else:
-        print("⚠️ Some services may need more time to start")
-        return False
+async def fetch_status(session, url, timeout):
+    """GET a URL, returning its status code or None if it could not be reached"""
+    if session is None:
+        return await asyncio.to_thread(fetch_status_blocking, url, timeout)
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            return response.status
+    except Exception:
+        return None
 
-if __name__ == "__main__":
-    main()
-"""
-    
-    with open("auto_start.py", "w") as f:
-        f.write(startup_script)
-    
-    print("  ✅ Created automated startup script")
+async def fetch_statuses(targets):
+    """Fetch every (url, timeout) target concurrently over one connection pool"""
+    if not AIOHTTP_AVAILABLE:
+        # Without aiohttp each blocking request runs on the default thread pool,
+        # sharing one session created up front
+        get_session()
+        return await asyncio.gather(*(fetch_status(None, url, timeout) for url, timeout in targets))
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(*(fetch_status(session, url, timeout) for url, timeout in targets))
 
-def run_platform_tests():
+async def run_platform_tests():
     """Run comprehensive platform tests"""
     print_step("🧪", "RUNNING PLATFORM TESTS")
     
-    try:
-        # Test AI integrations
-        response = requests.get("http://localhost:8008/ai/status", timeout=5)
-        if response.status_code == 200:
-            print("  ✅ AI integrations responding")
-        else:
-            print("  ⚠️ AI integrations may need attention")
-    except:
+    # Probe the AI integrations and both frontends at once
+    targets = [("http://localhost:8008/ai/status", 5)]
+    targets += [(f"http://localhost:{port}", 3) for port, name in FRONTENDS]
+    ai_status, *frontend_statuses = await fetch_statuses(targets)
+    
+    # Test AI integrations
+    if ai_status == 200:
+        print("  ✅ AI integrations responding")
+    elif ai_status is not None:
+        print("  ⚠️ AI integrations may need attention")
+    else:
         print("  ⚠️ Could not reach AI services")
     
     # Test frontend applications
-    frontends = [(3000, "Studio UI"), (3001, "Admin Dashboard")]
-    
-    for port, name in frontends:
-        try:
-            response = requests.get(f"http://localhost:{port}", timeout=3)
-            if response.status_code == 200:
-                print(f"  ✅ {name} responding")
-            else:
-                print(f"  ⚠️ {name} returned status {response.status_code}")
-        except:
+    for (port, name), status in zip(FRONTENDS, frontend_statuses):
+        if status == 200:
+            print(f"  ✅ {name} responding")
+        elif status is not None:
+            print(f"  ⚠️ {name} returned status {status}")
+        else:
             print(f"  ❌ {name} not responding")
 
-def main():
+async def main():
     """Main function to run all fixes"""
     print_header("VETRAI PLATFORM UNIVERSAL FIX")
     
     print("🎯 Applying comprehensive fixes to VetrAI platform...")
     
-    # Apply all fixes
-    fix_frontend_dependencies()
-    fix_docker_security_issues()
-    fix_minio_access()
+    # Check the frontend dirs once and hand the result to every fix that needs it
+    frontend_dirs = [d for d in FRONTEND_DIRS if Path(d).is_dir()]
+    
+    # npm installs and the MinIO exec are independent and slow: start them in the background
+    dependencies = asyncio.create_task(fix_frontend_dependencies(frontend_dirs))
+    minio = asyncio.create_task(fix_minio_access())
+    await asyncio.sleep(0)
+    
+    # The file edits take milliseconds, so they run inline while the subprocesses work
+    fix_docker_security_issues(frontend_dirs)
     fix_css_linting()
     optimize_docker_compose()
     create_healthcheck_improvements()
     create_startup_automation()
-    run_platform_tests()
+    
+    await asyncio.gather(dependencies, minio)
+    await run_platform_tests()
     
     print_header("ALL FIXES APPLIED")
     
@@ -373,4 +330,4 @@ def main():
     print("\n🎉 Your platform is now optimized and ready for production!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
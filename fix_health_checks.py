@@ -5,7 +5,13 @@ Installs curl in running containers for health checks
 """
 
 import subprocess
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import docker
+    DOCKER_SDK_AVAILABLE = True
+except ImportError:
+    DOCKER_SDK_AVAILABLE = False
 
 def install_curl_in_containers():
     """Install curl in running service containers"""
@@ -22,38 +28,46 @@ def install_curl_in_containers():
     
     print("Installing curl in service containers...")
     
-    for service in services:
-        try:
-            result = subprocess.run([
-                'docker', 'exec', service, 'apt-get', 'update'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                subprocess.run([
-                    'docker', 'exec', service, 'apt-get', 'install', '-y', 'curl'
-                ], capture_output=True, text=True)
-                print(f"✅ {service}: curl installed")
-            else:
-                print(f"⚠️ {service}: could not update packages")
+    def install_curl(service):
+        # One exec per container: update and install run in the same shell
+        return subprocess.run([
+            'docker', 'exec', service, 'sh', '-c', 'apt-get update && apt-get install -y curl'
+        ], capture_output=True, text=True)
+    
+    # Each container downloads its own package index, so run them all at once
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        futures = [executor.submit(install_curl, service) for service in services]
+        for service, future in zip(services, futures):
+            try:
+                result = future.result()
                 
-        except Exception as e:
-            print(f"❌ {service}: {e}")
+                if result.returncode == 0:
+                    print(f"✅ {service}: curl installed")
+                else:
+                    print(f"⚠️ {service}: could not install curl")
+                    
+            except Exception as e:
+                print(f"❌ {service}: {e}")
 
 def restart_backend_services():
-    """Restart backend services to apply health checks"""
+    """Bring backend services up and wait until their health checks pass"""
     print("\nRestarting backend services...")
+    print("⏳ Waiting for health checks...")
     
     try:
+        # --wait returns as soon as every service reports healthy instead of sleeping a fixed time.
+        # Unchanged containers are left running, so curl installed above is kept
         result = subprocess.run([
-            'docker-compose', '-f', 'docker-compose.backend.yml', 'restart'
+            'docker', 'compose', '-f', 'docker-compose.backend.yml',
+            'up', '-d', '--wait', '--wait-timeout', '60'
         ], capture_output=True, text=True)
         
         if result.returncode == 0:
-            print("✅ Backend services restarted")
-            print("⏳ Waiting for health checks...")
-            time.sleep(30)
+            print("✅ Backend services are up and healthy")
         else:
-            print("❌ Failed to restart services")
+            print("❌ Services did not become healthy")
+            if result.stderr.strip():
+                print(f"   {result.stderr.strip().splitlines()[-1]}")
             
     except Exception as e:
         print(f"❌ Error restarting services: {e}")
@@ -62,6 +76,18 @@ def check_health_status():
     """Check the health status of containers"""
     print("\nChecking container health status...")
     
+    if DOCKER_SDK_AVAILABLE:
+        # Ask the Docker daemon directly instead of spawning and parsing `docker ps`
+        try:
+            for container in docker.from_env().containers.list():
+                if 'vetrai_v5' in container.name:
+                    health = container.attrs.get('State', {}).get('Health', {}).get('Status')
+                    status = f"{container.status} ({health})" if health else container.status
+                    print(f"📊 {container.name}\t{status}")
+            return
+        except docker.errors.DockerException as e:
+            print(f"⚠️ Docker SDK unavailable ({e}), falling back to docker ps")
+    
     try:
         result = subprocess.run([
             'docker', 'ps', '--format', 'table {{.Names}}\t{{.Status}}'
@@ -3,20 +3,62 @@
 
 import re
 
-# Read the current docker-compose.backend.yml
-with open('docker-compose.backend.yml', 'r') as f:
-    content = f.read()
+try:
+    from ruamel.yaml import YAML
+    from ruamel.yaml.scalarstring import DoubleQuotedScalarString
+    RUAMEL_AVAILABLE = True
+except ImportError:
+    RUAMEL_AVAILABLE = False
 
-# Replace all curl health check commands with python equivalents
-new_content = re.sub(
-    r'test: \["CMD", "curl", "-f", "http://localhost:8000/health"\]',
-    'test: ["CMD", "python", "-c", "import urllib.request; urllib.request.urlopen(\'http://localhost:8000/health\')"]',
-    content
-)
+COMPOSE_FILE = 'docker-compose.backend.yml'
 
-# Write the updated content back
-with open('docker-compose.backend.yml', 'w') as f:
-    f.write(new_content)
+def python_health_check(url):
+    """Build a health check command that needs only the Python interpreter"""
+    return ["CMD", "python", "-c", f"import urllib.request; urllib.request.urlopen('{url}')"]
+
+def curl_health_url(test):
+    """Return the URL a ["CMD", "curl", ...] health check probes, or None if it is not one"""
+    if not isinstance(test, list) or list(test[:2]) != ["CMD", "curl"]:
+        return None
+    # The first http(s) argument, so flags such as -f or a trailing --max-time 5
+    # are never taken for the URL
+    return next((arg for arg in test[2:] if str(arg).startswith("http")), None)
+
+if RUAMEL_AVAILABLE:
+    # Round-trip load keeps comments, quoting and layout; only curl health checks are touched
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.indent(mapping=2, sequence=4, offset=2)
+    yaml.width = 4096
+
+    with open(COMPOSE_FILE, 'r') as f:
+        data = yaml.load(f)
+
+    for service in (data.get('services') or {}).values():
+        healthcheck = (service or {}).get('healthcheck') or {}
+        test = healthcheck.get('test')
+        url = curl_health_url(test)
+        if url is not None:
+            # Assign in place so the list keeps its inline [...] style
+            test[:] = [DoubleQuotedScalarString(arg) for arg in python_health_check(url)]
+
+    with open(COMPOSE_FILE, 'w') as f:
+        yaml.dump(data, f)
+else:
+    # Read the current docker-compose.backend.yml
+    with open(COMPOSE_FILE, 'r') as f:
+        content = f.read()
+
+    # Replace all curl health check commands with python equivalents
+    new_content = re.sub(
+        r'test: \["CMD", "curl", "-f", "http://localhost:8000/health"\]',
+        'test: ["CMD", "python", "-c", "import urllib.request; urllib.request.urlopen(\'http://localhost:8000/health\')"]',
+        content
+    )
+
+    # Write the updated content back
+    with open(COMPOSE_FILE, 'w') as f:
+        f.write(new_content)
 
 print("✅ Updated all health checks to use Python instead of curl")
-print("🔄 Health checks will now work properly with the containers")
\ No newline at end of file
+print("🔄 Health checks will now work properly with the containers")
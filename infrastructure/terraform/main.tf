@@ -1,4 +1,3 @@
-
 terraform {
   required_version = ">= 1.0"
   required_providers {
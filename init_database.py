@@ -4,9 +4,16 @@ Database Initialization Script for VetrAI Platform
 Creates necessary tables and schemas for all services
 """
 
-import psycopg2
+import functools
+import json
+import os
+import re
 import sys
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 # Database connection parameters
 DB_CONFIG = {
@@ -14,306 +21,356 @@ DB_CONFIG = {
     'port': '5432',
     'database': 'vetrai',
     'user': 'vetrai_user',
-    'password': 'vetrai_pass'
+    'password': 'vetrai_pass',
+    # Local connection: skip the SSL and GSSAPI negotiation libpq would otherwise
+    # attempt first, each an extra round-trip before authentication even starts
+    'sslmode': 'disable',
+    'gssencmode': 'disable'
 }
 
+# Upper bound on open connections; index builds use all but the main one
+POOL_SIZE = 16
+
+# Shared pool so repeated initializations reuse warm connections; it is
+# opened on first use so importing this module never touches the database
+_pool = None
+
+def get_pool():
+    """Return the shared connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(1, POOL_SIZE, **DB_CONFIG)
+    return _pool
+
+# Table DDL lives in schema.sql, one section per service; Auth and Tenancy come
+# first because every other service's tables reference them
+SCHEMA_FILE = Path(__file__).parent / "schema.sql"
+
+# api_key_usage is range-partitioned by month; each run keeps partitions this many
+# months ahead, starting with the current one, and queues a job to roll them on,
+# which "init_database.py --maintain-partitions" runs once it is due
+USAGE_PARTITION_MONTHS = 3
+PARTITION_JOB_TYPE = "create_api_key_usage_partitions"
+
+# Indexes as (name, table, definition), created once every table exists
+INDEXES = (
+    ("idx_users_email", "users", "(email)"),
+    ("idx_users_username", "users", "(username)"),
+    ("idx_tenant_users_tenant_id", "tenant_users", "(tenant_id)"),
+    ("idx_api_keys_user_id", "api_keys", "(user_id)"),
+    ("idx_api_keys_tenant_id", "api_keys", "(tenant_id)"),
+    ("idx_support_tickets_user_id", "support_tickets", "(user_id)"),
+    ("idx_notifications_user_id", "notifications", "(user_id)"),
+    ("idx_workflow_executions_user_id", "workflow_executions", "(user_id)"),
+    # Foreign key columns not already leading another index, so ON DELETE CASCADE
+    # and FK checks on parent deletes look rows up instead of scanning the child
+    ("idx_tenant_users_user_id", "tenant_users", "(user_id)"),
+    ("idx_api_key_usage_api_key_id", "api_key_usage", "(api_key_id)"),
+    ("idx_invoices_billing_account_id", "invoices", "(billing_account_id)"),
+    ("idx_support_tickets_tenant_id", "support_tickets", "(tenant_id)"),
+    ("idx_ticket_messages_ticket_id", "ticket_messages", "(ticket_id)"),
+    ("idx_ticket_messages_user_id", "ticket_messages", "(user_id)"),
+    ("idx_themes_tenant_id", "themes", "(tenant_id)"),
+    ("idx_themes_created_by", "themes", "(created_by)"),
+    ("idx_user_theme_preferences_theme_id", "user_theme_preferences", "(theme_id)"),
+    ("idx_notifications_tenant_id", "notifications", "(tenant_id)"),
+    ("idx_workflow_executions_tenant_id", "workflow_executions", "(tenant_id)"),
+    # Partial and composite indexes shaped after the hot queries: the scheduler only
+    # polls pending jobs, inboxes badge unread notifications, and session checks
+    # look up a user's sessions by expiry
+    ("idx_background_jobs_pending", "background_jobs", "(scheduled_at) WHERE status = 'pending'"),
+    ("idx_notifications_unread", "notifications", "(user_id) WHERE is_read = FALSE"),
+    ("idx_user_sessions_user_expires", "user_sessions", "(user_id, expires_at)"),
+    # Append-only timestamps grow with insertion order, so a BRIN summary per
+    # 32 pages serves their range scans at a tiny fraction of a B-tree's size
+    ("idx_api_key_usage_requested_at", "api_key_usage", "USING BRIN (requested_at) WITH (pages_per_range = 32)"),
+    ("idx_notifications_created_at", "notifications", "USING BRIN (created_at) WITH (pages_per_range = 32)"),
+    ("idx_background_jobs_created_at", "background_jobs", "USING BRIN (created_at) WITH (pages_per_range = 32)")
+)
+
+# Default data as (table, columns, conflict target, rows); rows that conflict are skipped
+SEED_DATA = (
+    ("tenants", ("name", "subdomain", "plan"), "(subdomain)", [
+        ("VetrAI Demo", "demo", "enterprise")
+    ]),
+    ("themes", ("name", "description", "config", "is_default"), "", [
+        ("Default Theme", "VetrAI default theme configuration",
+         '{"colors": {"primary": "#3B82F6", "secondary": "#10B981"}, "typography": {"fontFamily": "Inter"}}',
+         True)
+    ])
+)
+
+def insert_seed_rows(cursor, table, columns, conflict_target, rows):
+    """Insert seed rows as multi-row VALUES statements of up to 100 rows, skipping conflicts"""
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s ON CONFLICT {conflict_target} DO NOTHING"
+    execute_values(cursor, sql, rows, page_size=100)
+
+@functools.lru_cache(maxsize=1)
+def load_schema_sections():
+    """Read schema.sql and split it into (title, DDL) pairs at each section header, once per process"""
+    schema = SCHEMA_FILE.read_text(encoding="utf-8")
+    # re.split with a group yields [preamble, title, body, title, body, ...]
+    parts = re.split(r"^-- (.+ Service Tables)$", schema, flags=re.M)
+    # A tuple, so the cached result cannot be modified by a caller
+    return tuple(zip(parts[1::2], parts[2::2]))
+
+def index_sql(name, table, definition, concurrently=False):
+    """Build the CREATE INDEX statement for one INDEXES entry"""
+    mode = "CONCURRENTLY " if concurrently else ""
+    return f"CREATE INDEX {mode}IF NOT EXISTS {name} ON {table} {definition}"
+
+def build_index(name, table, definition, concurrently):
+    """Build one index on its own pooled connection, without blocking writes if concurrently"""
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        # CONCURRENTLY cannot run inside a transaction block
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(index_sql(name, table, definition, concurrently))
+    finally:
+        pool.putconn(conn)
+
+def indexed_tables_have_data(cursor):
+    """Return whether any table in INDEXES already holds rows"""
+    tables = sorted({table for name, table, definition in INDEXES})
+    cursor.execute("SELECT " + " OR ".join(f"EXISTS (SELECT 1 FROM {table})" for table in tables))
+    has_data, = cursor.fetchone()
+    return has_data
+
+def create_indexes(cursor):
+    """Create every index as one plain batch in the open transaction, for empty tables"""
+    cursor.execute(";\n".join(index_sql(*index) for index in INDEXES))
+
+def create_indexes_concurrently(cursor):
+    """Build every missing index side by side without locking out writers, for populated tables"""
+    # CONCURRENTLY waits out every open transaction, this connection's included:
+    # only call this after the commit, and keep the lookup below from opening one
+    cursor.connection.autocommit = True
+    tables = sorted({table for name, table, definition in INDEXES})
+    
+    # Partitioned tables do not support CONCURRENTLY; they get plain builds
+    cursor.execute("SELECT relname FROM pg_class WHERE relkind = 'p' AND relname = ANY(%s)", (tables,))
+    partitioned = {relname for relname, in cursor.fetchall()}
+    
+    workers = min(len(INDEXES), os.cpu_count() or 1, POOL_SIZE - 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(build_index, name, table, definition, table not in partitioned)
+                   for name, table, definition in INDEXES]
+        for future in futures:
+            future.result()
+
+def add_months(day, months):
+    """Return the first day of the month that is the given number of months after day's month"""
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+def create_month_partition(cursor, start, end):
+    """Create the api_key_usage partition for [start, end), taking over rows the default partition caught"""
+    name = f"api_key_usage_{start:%Y_%m}"
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+    exists, = cursor.fetchone()
+    if exists:
+        return
+    
+    create = (f"CREATE UNLOGGED TABLE {name} PARTITION OF api_key_usage "
+              f"FOR VALUES FROM ('{start}') TO ('{end}')")
+    cursor.execute("SELECT EXISTS (SELECT 1 FROM api_key_usage_default WHERE requested_at >= %s AND requested_at < %s)",
+                   (start, end))
+    stranded, = cursor.fetchone()
+    if not stranded:
+        cursor.execute(create)
+        return
+    
+    # Maintenance fell behind and the default partition already holds rows for this
+    # month, so PostgreSQL would reject the new range: detach the default, create
+    # the partition, route the rows into it through the parent, then reattach
+    in_range = f"requested_at >= '{start}' AND requested_at < '{end}'"
+    cursor.execute(";\n".join((
+        "ALTER TABLE api_key_usage DETACH PARTITION api_key_usage_default",
+        create,
+        f"INSERT INTO api_key_usage OVERRIDING SYSTEM VALUE SELECT * FROM api_key_usage_default WHERE {in_range}",
+        f"DELETE FROM api_key_usage_default WHERE {in_range}",
+        "ALTER TABLE api_key_usage ATTACH PARTITION api_key_usage_default DEFAULT"
+    )))
+
+def create_usage_partitions(cursor, months=USAGE_PARTITION_MONTHS):
+    """Create api_key_usage's default partition and monthly partitions from the current month on"""
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = 'api_key_usage'::regclass")
+    relkind, = cursor.fetchone()
+    if relkind != 'p':
+        # Databases initialized before partitioning keep their flat table
+        return False
+    
+    # The default partition catches rows outside the monthly ranges, so inserts
+    # never fail if maintenance falls behind. Partitions are UNLOGGED (a partitioned
+    # parent cannot be): usage telemetry is cheap to lose and costly to WAL-log
+    cursor.execute("CREATE UNLOGGED TABLE IF NOT EXISTS api_key_usage_default PARTITION OF api_key_usage DEFAULT")
+    this_month = date.today()
+    for offset in range(months):
+        create_month_partition(cursor, add_months(this_month, offset), add_months(this_month, offset + 1))
+    return True
+
+def schedule_partition_maintenance(cursor):
+    """Queue a job for next month to roll api_key_usage partitions forward, unless one is pending"""
+    cursor.execute("""
+        INSERT INTO background_jobs (job_type, job_data, scheduled_at)
+        SELECT %(job_type)s, %(job_data)s, date_trunc('month', CURRENT_TIMESTAMP) + INTERVAL '1 month'
+        WHERE NOT EXISTS (
+            SELECT 1 FROM background_jobs WHERE job_type = %(job_type)s AND status = 'pending'
+        )
+    """, {
+        "job_type": PARTITION_JOB_TYPE,
+        "job_data": json.dumps({"table": "api_key_usage", "months_ahead": USAGE_PARTITION_MONTHS})
+    })
+
+def run_partition_jobs():
+    """Run every due partition maintenance job, each in its own transaction, and queue the next one"""
+    pool = get_pool()
+    conn = pool.getconn()
+    conn.autocommit = False
+    completed = failed = 0
+    try:
+        while True:
+            with conn.cursor() as cursor:
+                # SKIP LOCKED lets overlapping runs share the queue without blocking
+                cursor.execute("""
+                    SELECT id, job_data FROM background_jobs
+                    WHERE job_type = %s AND status = 'pending' AND scheduled_at <= CURRENT_TIMESTAMP
+                    ORDER BY scheduled_at
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                """, (PARTITION_JOB_TYPE,))
+                job = cursor.fetchone()
+                if job is None:
+                    conn.commit()
+                    break
+                job_id, job_data = job
+                
+                try:
+                    create_usage_partitions(cursor, job_data.get("months_ahead", USAGE_PARTITION_MONTHS))
+                    cursor.execute("""
+                        UPDATE background_jobs
+                        SET status = 'completed', started_at = CURRENT_TIMESTAMP, completed_at = CURRENT_TIMESTAMP
+                        WHERE id = %s
+                    """, (job_id,))
+                    schedule_partition_maintenance(cursor)
+                    conn.commit()
+                    completed += 1
+                except Exception as e:
+                    conn.rollback()
+                    # Retried on the next run until max_retries is used up
+                    cursor.execute("""
+                        UPDATE background_jobs
+                        SET retry_count = retry_count + 1,
+                            error_message = %s,
+                            status = CASE WHEN retry_count + 1 >= max_retries THEN 'failed' ELSE status END
+                        WHERE id = %s
+                    """, (str(e), job_id))
+                    conn.commit()
+                    failed += 1
+                    # Leave the job for the next run rather than retrying it right away
+                    break
+    finally:
+        pool.putconn(conn)
+    
+    return completed, failed
+
 def create_tables():
     """Create all necessary tables for the services"""
     
-    print("🔧 Initializing VetrAI Database Schema...")
-    print("=" * 50)
+    # Progress lines are collected and written out in one go when the run ends,
+    # so stdout never stalls the database work in between
+    report = []
     
+    report.append("🔧 Initializing VetrAI Database Schema...")
+    report.append("=" * 50)
+    
+    conn = None
     try:
-        # Connect to database
-        conn = psycopg2.connect(**DB_CONFIG)
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        # Borrow a connection from the shared pool; its work is committed explicitly
+        conn = get_pool().getconn()
+        conn.autocommit = False
         cursor = conn.cursor()
         
-        print("✅ Connected to PostgreSQL database")
-        
-        # Auth Service Tables
-        print("\n📋 Creating Auth Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id SERIAL PRIMARY KEY,
-            email VARCHAR(255) UNIQUE NOT NULL,
-            username VARCHAR(100) UNIQUE,
-            password_hash VARCHAR(255) NOT NULL,
-            first_name VARCHAR(100),
-            last_name VARCHAR(100),
-            is_active BOOLEAN DEFAULT TRUE,
-            is_verified BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE TABLE IF NOT EXISTS user_sessions (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            session_token VARCHAR(255) UNIQUE NOT NULL,
-            refresh_token VARCHAR(255) UNIQUE,
-            expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        print("  ✅ Users and sessions tables created")
-        
-        # Tenancy Service Tables  
-        print("\n🏢 Creating Tenancy Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tenants (
-            id SERIAL PRIMARY KEY,
-            name VARCHAR(255) NOT NULL,
-            subdomain VARCHAR(100) UNIQUE,
-            domain VARCHAR(255),
-            is_active BOOLEAN DEFAULT TRUE,
-            plan VARCHAR(50) DEFAULT 'free',
-            settings JSONB DEFAULT '{}',
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE TABLE IF NOT EXISTS tenant_users (
-            id SERIAL PRIMARY KEY,
-            tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            role VARCHAR(50) DEFAULT 'member',
-            permissions JSONB DEFAULT '{}',
-            joined_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(tenant_id, user_id)
-        );
-        """)
-        print("  ✅ Tenant management tables created")
-        
-        # API Keys Service Tables
-        print("\n🔑 Creating API Keys Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS api_keys (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
-            name VARCHAR(255) NOT NULL,
-            key_hash VARCHAR(255) UNIQUE NOT NULL,
-            key_prefix VARCHAR(20) NOT NULL,
-            permissions JSONB DEFAULT '[]',
-            is_active BOOLEAN DEFAULT TRUE,
-            last_used_at TIMESTAMP WITH TIME ZONE,
-            expires_at TIMESTAMP WITH TIME ZONE,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE TABLE IF NOT EXISTS api_key_usage (
-            id SERIAL PRIMARY KEY,
-            api_key_id INTEGER REFERENCES api_keys(id) ON DELETE CASCADE,
-            endpoint VARCHAR(255),
-            method VARCHAR(10),
-            status_code INTEGER,
-            response_time_ms INTEGER,
-            requested_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        print("  ✅ API keys and usage tracking tables created")
-        
-        # Billing Service Tables
-        print("\n💳 Creating Billing Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS billing_accounts (
-            id SERIAL PRIMARY KEY,
-            tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE UNIQUE,
-            plan_type VARCHAR(50) DEFAULT 'free',
-            billing_cycle VARCHAR(20) DEFAULT 'monthly',
-            payment_method JSONB,
-            billing_address JSONB,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE TABLE IF NOT EXISTS invoices (
-            id SERIAL PRIMARY KEY,
-            billing_account_id INTEGER REFERENCES billing_accounts(id) ON DELETE CASCADE,
-            invoice_number VARCHAR(100) UNIQUE NOT NULL,
-            amount_cents INTEGER NOT NULL,
-            currency VARCHAR(3) DEFAULT 'USD',
-            status VARCHAR(20) DEFAULT 'pending',
-            due_date DATE,
-            paid_at TIMESTAMP WITH TIME ZONE,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        print("  ✅ Billing and invoice tables created")
-        
-        # Support Service Tables
-        print("\n🎧 Creating Support Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS support_tickets (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
-            title VARCHAR(255) NOT NULL,
-            description TEXT,
-            status VARCHAR(20) DEFAULT 'open',
-            priority VARCHAR(20) DEFAULT 'medium',
-            category VARCHAR(50),
-            assigned_to INTEGER,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE TABLE IF NOT EXISTS ticket_messages (
-            id SERIAL PRIMARY KEY,
-            ticket_id INTEGER REFERENCES support_tickets(id) ON DELETE CASCADE,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            message TEXT NOT NULL,
-            is_internal BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        print("  ✅ Support ticket tables created")
+        report.append("✅ Connected to PostgreSQL database")
         
-        # Themes Service Tables
-        print("\n🎨 Creating Themes Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS themes (
-            id SERIAL PRIMARY KEY,
-            name VARCHAR(255) NOT NULL,
-            description TEXT,
-            config JSONB NOT NULL,
-            is_default BOOLEAN DEFAULT FALSE,
-            is_custom BOOLEAN DEFAULT FALSE,
-            tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
-            created_by INTEGER REFERENCES users(id),
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
+        report.append("\n📋 Creating service tables...")
+        # Each service's DDL in schema.sql order, on this connection and in its transaction
+        for title, sql in load_schema_sections():
+            cursor.execute(sql)
+            report.append(f"  ✅ {title} created")
         
-        CREATE TABLE IF NOT EXISTS user_theme_preferences (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            theme_id INTEGER REFERENCES themes(id) ON DELETE CASCADE,
-            preferences JSONB DEFAULT '{}',
-            is_active BOOLEAN DEFAULT TRUE,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(user_id, theme_id)
-        );
-        """)
-        print("  ✅ Theme management tables created")
+        if create_usage_partitions(cursor):
+            report.append("  ✅ API key usage monthly partitions created")
         
-        # Notifications Service Tables
-        print("\n🔔 Creating Notifications Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS notifications (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
-            title VARCHAR(255) NOT NULL,
-            message TEXT,
-            type VARCHAR(50) DEFAULT 'info',
-            channel VARCHAR(50) DEFAULT 'in_app',
-            is_read BOOLEAN DEFAULT FALSE,
-            metadata JSONB DEFAULT '{}',
-            scheduled_at TIMESTAMP WITH TIME ZONE,
-            sent_at TIMESTAMP WITH TIME ZONE,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE TABLE IF NOT EXISTS notification_preferences (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            channel VARCHAR(50) NOT NULL,
-            enabled BOOLEAN DEFAULT TRUE,
-            settings JSONB DEFAULT '{}',
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(user_id, channel)
-        );
-        """)
-        print("  ✅ Notification tables created")
-        
-        # Workers Service Tables
-        print("\n⚙️ Creating Workers Service tables...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS background_jobs (
-            id SERIAL PRIMARY KEY,
-            job_type VARCHAR(100) NOT NULL,
-            job_data JSONB NOT NULL,
-            status VARCHAR(20) DEFAULT 'pending',
-            priority INTEGER DEFAULT 0,
-            max_retries INTEGER DEFAULT 3,
-            retry_count INTEGER DEFAULT 0,
-            result JSONB,
-            error_message TEXT,
-            scheduled_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            started_at TIMESTAMP WITH TIME ZONE,
-            completed_at TIMESTAMP WITH TIME ZONE,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE TABLE IF NOT EXISTS workflow_executions (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-            tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
-            workflow_name VARCHAR(255) NOT NULL,
-            workflow_config JSONB NOT NULL,
-            status VARCHAR(20) DEFAULT 'running',
-            input_data JSONB,
-            output_data JSONB,
-            error_details TEXT,
-            started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-            completed_at TIMESTAMP WITH TIME ZONE
-        );
-        """)
-        print("  ✅ Background job and workflow tables created")
-        
-        # Create indexes for better performance
-        print("\n📈 Creating database indexes...")
-        cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
-        CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
-        CREATE INDEX IF NOT EXISTS idx_tenant_users_tenant_id ON tenant_users(tenant_id);
-        CREATE INDEX IF NOT EXISTS idx_api_keys_user_id ON api_keys(user_id);
-        CREATE INDEX IF NOT EXISTS idx_api_keys_tenant_id ON api_keys(tenant_id);
-        CREATE INDEX IF NOT EXISTS idx_support_tickets_user_id ON support_tickets(user_id);
-        CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON notifications(user_id);
-        CREATE INDEX IF NOT EXISTS idx_background_jobs_status ON background_jobs(status);
-        CREATE INDEX IF NOT EXISTS idx_workflow_executions_user_id ON workflow_executions(user_id);
-        """)
-        print("  ✅ Database indexes created")
+        # Create indexes for better performance. Checked before seeding, which
+        # would make every database look populated
+        report.append("\n📈 Creating database indexes...")
+        populated = indexed_tables_have_data(cursor)
+        if not populated:
+            # Nothing to scan on a fresh database: build them in this transaction
+            create_indexes(cursor)
+            report.append("  ✅ Database indexes created")
+        else:
+            report.append("  ⏳ Tables hold data: indexes are built concurrently after the commit")
         
         # Insert default data
-        print("\n💾 Inserting default data...")
-        
-        # Default tenant
-        cursor.execute("""
-        INSERT INTO tenants (name, subdomain, plan) 
-        VALUES ('VetrAI Demo', 'demo', 'enterprise') 
-        ON CONFLICT (subdomain) DO NOTHING;
-        """)
+        report.append("\n💾 Inserting default data...")
+        for table, columns, conflict_target, rows in SEED_DATA:
+            insert_seed_rows(cursor, table, columns, conflict_target, rows)
+        schedule_partition_maintenance(cursor)
         
-        # Default theme
-        cursor.execute("""
-        INSERT INTO themes (name, description, config, is_default) 
-        VALUES (
-            'Default Theme', 
-            'VetrAI default theme configuration',
-            '{"colors": {"primary": "#3B82F6", "secondary": "#10B981"}, "typography": {"fontFamily": "Inter"}}',
-            true
-        ) ON CONFLICT DO NOTHING;
-        """)
+        # Tables, partitions, indexes and seed rows land in one commit, so a
+        # failed initialization leaves no partial schema behind
+        conn.commit()
+        report.append("  ✅ Default data inserted")
         
-        print("  ✅ Default data inserted")
+        if populated:
+            # Live data: any missing index is built concurrently once the schema is committed
+            create_indexes_concurrently(cursor)
+            report.append("  ✅ Database indexes built concurrently")
         
         cursor.close()
-        conn.close()
         
-        print("\n🎉 Database initialization completed successfully!")
-        print("📊 All service tables and indexes created")
-        print("🚀 VetrAI platform is ready to use!")
+        report.append("\n🎉 Database initialization completed successfully!")
+        report.append("📊 All service tables and indexes created")
+        report.append("🚀 VetrAI platform is ready to use!")
         
         return True
         
     except Exception as e:
-        print(f"\n❌ Database initialization failed: {e}")
+        # Leave nothing half-applied from the open transaction
+        if conn is not None and not conn.closed:
+            conn.rollback()
+        report.append(f"\n❌ Database initialization failed: {e}")
+        return False
+    
+    finally:
+        # Hand the connection back so the next initialization skips the connect
+        if conn is not None:
+            get_pool().putconn(conn)
+        
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
+
+def maintain_partitions():
+    """Run the queued partition maintenance jobs that are due, reporting the outcome"""
+    try:
+        completed, failed = run_partition_jobs()
+    except Exception as e:
+        print(f"❌ Partition maintenance failed: {e}")
         return False
+    
+    icon = "✅" if failed == 0 else "⚠️"
+    print(f"{icon} Partition maintenance jobs completed: {completed}, failed: {failed}")
+    return failed == 0
 
 if __name__ == "__main__":
-    success = create_tables()
+    # --maintain-partitions runs the queued partition jobs instead of initializing;
+    # schedule it daily, e.g. "0 3 * * * python init_database.py --maintain-partitions"
+    if "--maintain-partitions" in sys.argv[1:]:
+        success = maintain_partitions()
+    else:
+        success = create_tables()
     sys.exit(0 if success else 1)
\ No newline at end of file
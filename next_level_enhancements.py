@@ -4,72 +4,53 @@ VetrAI Platform - Next Level Enhancements
 Production-ready features and enterprise capabilities
 """
 
-import subprocess
-import json
-import os
-import requests
+import asyncio
+import functools
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
-from datetime import datetime
 
-def print_header(title):
-    print(f"\n{'='*60}")
-    print(f"🚀 {title}")
-    print(f"{'='*60}")
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
 
-def print_step(step, description):
-    print(f"\n{step} {description}")
-    print("-" * 50)
+# Banner rules, built once rather than on every header
+HEADER_RULE = "=" * 60
+STEP_RULE = "-" * 50
 
-def create_advanced_monitoring():
-    """Create comprehensive monitoring and alerting system"""
-    print_step("📊", "CREATING ADVANCED MONITORING SYSTEM")
-    
-    # Create monitoring directory
-    os.makedirs("monitoring", exist_ok=True)
-    
-    # Create advanced Grafana dashboard configuration
-    grafana_dashboard = {
-        "dashboard": {
-            "title": "VetrAI Platform - Executive Dashboard",
-            "panels": [
-                {
-                    "title": "Business Metrics",
-                    "type": "stat",
-                    "targets": [
-                        {"expr": "sum(vetrai_total_users)", "legendFormat": "Total Users"},
-                        {"expr": "sum(vetrai_active_organizations)", "legendFormat": "Active Orgs"},
-                        {"expr": "sum(vetrai_monthly_revenue)", "legendFormat": "Monthly Revenue"},
-                        {"expr": "sum(vetrai_ai_workflows_created)", "legendFormat": "AI Workflows"}
-                    ]
-                },
-                {
-                    "title": "AI Performance",
-                    "type": "graph",
-                    "targets": [
-                        {"expr": "rate(vetrai_ai_requests_total[5m])", "legendFormat": "AI Requests/sec"},
-                        {"expr": "histogram_quantile(0.95, vetrai_ai_request_duration_seconds)", "legendFormat": "95th percentile latency"},
-                        {"expr": "rate(vetrai_ai_errors_total[5m])", "legendFormat": "Error Rate"}
-                    ]
-                },
-                {
-                    "title": "Service Health Matrix",
-                    "type": "heatmap",
-                    "targets": [
-                        {"expr": "up{job=~'vetrai-.*'}", "legendFormat": "Service Status"}
-                    ]
-                }
-            ]
-        }
-    }
-    
-    with open("monitoring/grafana_advanced_dashboard.json", "w") as f:
-        json.dump(grafana_dashboard, f, indent=2)
-    
-    print("  ✅ Advanced Grafana dashboard created")
-    
-    # Create alerting rules
-    alerting_rules = """
-groups:
+# Static JSON configs pre-serialized by scripts/bake_configs.py
+BAKED_DIR = Path(__file__).resolve().parent / "assets" / "baked"
+
+# Generated files are small, so one thread per file is plenty
+WRITE_WORKERS = 8
+
+# Every directory the generators write into, created once up front
+OUTPUT_DIRS = (
+    "monitoring",
+    "config",
+    "templates/ai_workflows",
+    "infrastructure/k8s",
+    "infrastructure/terraform",
+    "infrastructure/istio",
+    ".github/workflows"
+)
+
+# Model settings shared by the LLM nodes of the workflow templates; node configs
+# reference or extend these, and they are expanded inline when encoded
+MODEL_CONFIGS = {
+    "gpt4": {"model": "gpt-4"},
+    "gpt4_low_temp": {"model": "gpt-4", "temperature": 0.3},
+    "claude3": {"model": "claude-3"}
+}
+
+# Static templates, built once at import and reused on every call
+
+# Prometheus alerting rules
+ALERTING_RULES = """groups:
   - name: VetrAI Platform Alerts
     rules:
       - alert: HighErrorRate
@@ -96,63 +77,9 @@ groups:
         annotations:
           summary: "High AI processing latency"
 """
-    
-    os.makedirs("monitoring", exist_ok=True)
-    with open("monitoring/alerting_rules.yml", "w") as f:
-        f.write(alerting_rules)
-    
-    print("  ✅ Alerting rules created")
 
-def implement_advanced_security():
-    """Implement enterprise security features"""
-    print_step("🔐", "IMPLEMENTING ENTERPRISE SECURITY")
-    
-    # Create config directory
-    os.makedirs("config", exist_ok=True)
-    
-    # Create OAuth2/OIDC integration
-    oauth_config = {
-        "providers": {
-            "google": {
-                "client_id": "${GOOGLE_CLIENT_ID}",
-                "client_secret": "${GOOGLE_CLIENT_SECRET}",
-                "redirect_uri": "https://yourdomain.com/auth/google/callback"
-            },
-            "microsoft": {
-                "client_id": "${MICROSOFT_CLIENT_ID}",
-                "client_secret": "${MICROSOFT_CLIENT_SECRET}",
-                "tenant": "${MICROSOFT_TENANT_ID}"
-            },
-            "okta": {
-                "issuer": "${OKTA_ISSUER}",
-                "client_id": "${OKTA_CLIENT_ID}",
-                "client_secret": "${OKTA_CLIENT_SECRET}"
-            }
-        },
-        "jwt": {
-            "secret": "${JWT_SECRET}",
-            "expiry": "24h",
-            "refresh_expiry": "7d"
-        },
-        "rbac": {
-            "roles": ["admin", "manager", "developer", "viewer"],
-            "permissions": {
-                "admin": ["*"],
-                "manager": ["read:*", "write:workflows", "manage:team"],
-                "developer": ["read:*", "write:workflows", "execute:ai"],
-                "viewer": ["read:workflows", "read:results"]
-            }
-        }
-    }
-    
-    with open("config/auth_config.json", "w") as f:
-        json.dump(oauth_config, f, indent=2)
-    
-    print("  ✅ OAuth2/OIDC configuration created")
-    
-    # Create API rate limiting configuration
-    rate_limiting = """
-rate_limiting:
+# API rate limits
+RATE_LIMITING = """rate_limiting:
   global:
     requests_per_minute: 1000
   per_user:
@@ -165,131 +92,9 @@ rate_limiting:
   premium_users:
     requests_per_minute: 500
 """
-    
-    os.makedirs("config", exist_ok=True)
-    with open("config/rate_limiting.yml", "w") as f:
-        f.write(rate_limiting)
-    
-    print("  ✅ Rate limiting configuration created")
-
-def create_ai_workflow_templates():
-    """Create advanced AI workflow templates"""
-    print_step("🤖", "CREATING ADVANCED AI WORKFLOW TEMPLATES")
-    
-    ai_templates = {
-        "document_processing": {
-            "name": "Document Intelligence Pipeline",
-            "description": "Extract, analyze, and categorize documents using AI",
-            "nodes": [
-                {
-                    "id": "doc_upload",
-                    "type": "file_input",
-                    "config": {"accepted_types": ["pdf", "docx", "txt"]}
-                },
-                {
-                    "id": "ocr_extraction",
-                    "type": "ai_ocr",
-                    "config": {"engine": "tesseract", "languages": ["en", "es", "fr"]}
-                },
-                {
-                    "id": "text_analysis",
-                    "type": "llm_analysis",
-                    "config": {
-                        "model": "gpt-4",
-                        "tasks": ["sentiment", "entities", "classification"]
-                    }
-                },
-                {
-                    "id": "data_storage",
-                    "type": "database_insert",
-                    "config": {"table": "processed_documents"}
-                }
-            ]
-        },
-        "customer_support_automation": {
-            "name": "AI Customer Support Agent",
-            "description": "Automated customer support with escalation",
-            "nodes": [
-                {
-                    "id": "query_input",
-                    "type": "text_input",
-                    "config": {"source": "chat", "webhook": "/api/support"}
-                },
-                {
-                    "id": "intent_classification",
-                    "type": "llm_classifier",
-                    "config": {
-                        "model": "claude-3",
-                        "classes": ["technical", "billing", "general", "complaint"]
-                    }
-                },
-                {
-                    "id": "knowledge_search",
-                    "type": "vector_search",
-                    "config": {"index": "support_kb", "top_k": 5}
-                },
-                {
-                    "id": "response_generation",
-                    "type": "llm_response",
-                    "config": {"model": "gpt-4", "temperature": 0.3}
-                },
-                {
-                    "id": "escalation_check",
-                    "type": "conditional",
-                    "config": {"condition": "confidence < 0.8"}
-                }
-            ]
-        },
-        "data_analytics_pipeline": {
-            "name": "Real-time Data Analytics",
-            "description": "Process and analyze streaming data with AI insights",
-            "nodes": [
-                {
-                    "id": "data_ingestion",
-                    "type": "stream_input",
-                    "config": {"source": "kafka", "topic": "user_events"}
-                },
-                {
-                    "id": "data_cleaning",
-                    "type": "data_processor",
-                    "config": {"operations": ["normalize", "validate", "enrich"]}
-                },
-                {
-                    "id": "anomaly_detection",
-                    "type": "ml_detector",
-                    "config": {"algorithm": "isolation_forest", "threshold": 0.05}
-                },
-                {
-                    "id": "trend_analysis",
-                    "type": "llm_analyst",
-                    "config": {"model": "claude-3", "analysis_type": "trends"}
-                },
-                {
-                    "id": "dashboard_update",
-                    "type": "websocket_emit",
-                    "config": {"channel": "analytics_dashboard"}
-                }
-            ]
-        }
-    }
-    
-    os.makedirs("templates/ai_workflows", exist_ok=True)
-    with open("templates/ai_workflows/enterprise_templates.json", "w") as f:
-        json.dump(ai_templates, f, indent=2)
-    
-    print("  ✅ Enterprise AI workflow templates created")
 
-def setup_production_infrastructure():
-    """Setup production-ready infrastructure configurations"""
-    print_step("🏗️", "SETTING UP PRODUCTION INFRASTRUCTURE")
-    
-    # Create infrastructure directories
-    os.makedirs("infrastructure/k8s", exist_ok=True)
-    os.makedirs("infrastructure/terraform", exist_ok=True)
-    
-    # Create Kubernetes deployment manifests
-    k8s_manifests = """
-apiVersion: v1
+# Kubernetes manifests for the auth service
+K8S_MANIFESTS = """apiVersion: v1
 kind: Namespace
 metadata:
   name: vetrai-prod
@@ -347,14 +152,9 @@ spec:
     targetPort: 8000
   type: ClusterIP
 """
-    
-    os.makedirs("infrastructure/k8s", exist_ok=True)
-    with open("infrastructure/k8s/auth-service.yaml", "w") as f:
-        f.write(k8s_manifests)
-    
-    # Create Terraform configuration
-    terraform_config = """
-terraform {
+
+# Terraform for the AWS production stack
+TERRAFORM_CONFIG = """terraform {
   required_version = ">= 1.0"
   required_providers {
     aws = {
@@ -431,22 +231,9 @@ resource "aws_elasticache_replication_group" "vetrai" {
   transit_encryption_enabled = true
 }
 """
-    
-    os.makedirs("infrastructure/terraform", exist_ok=True)
-    with open("infrastructure/terraform/main.tf", "w") as f:
-        f.write(terraform_config)
-    
-    print("  ✅ Infrastructure as Code templates created")
 
-def create_ci_cd_pipeline():
-    """Create comprehensive CI/CD pipeline"""
-    print_step("🔄", "CREATING CI/CD PIPELINE")
-    
-    # Create GitHub workflows directory
-    os.makedirs(".github/workflows", exist_ok=True)
-    
-    github_actions = """
-name: VetrAI Platform CI/CD
+# GitHub Actions CI/CD workflow
+GITHUB_ACTIONS = """name: VetrAI Platform CI/CD
 
 on:
   push:
@@ -566,92 +353,9 @@ jobs:
         # Deploy to production
         echo "Deploying to production..."
 """
-    
-    os.makedirs(".github/workflows", exist_ok=True)
-    with open(".github/workflows/ci-cd.yml", "w") as f:
-        f.write(github_actions)
-    
-    print("  ✅ GitHub Actions CI/CD pipeline created")
 
-def implement_advanced_analytics():
-    """Implement advanced analytics and insights"""
-    print_step("📈", "IMPLEMENTING ADVANCED ANALYTICS")
-    
-    # Create config directory
-    os.makedirs("config", exist_ok=True)
-    
-    # Create analytics service configuration
-    analytics_config = {
-        "data_sources": {
-            "user_events": {
-                "type": "kafka",
-                "topic": "user.events",
-                "schema": {
-                    "user_id": "string",
-                    "event_type": "string",
-                    "timestamp": "datetime",
-                    "properties": "json"
-                }
-            },
-            "ai_metrics": {
-                "type": "prometheus",
-                "metrics": [
-                    "ai_request_duration",
-                    "ai_request_count",
-                    "model_accuracy",
-                    "token_usage"
-                ]
-            }
-        },
-        "analytics_pipelines": {
-            "user_behavior": {
-                "input": "user_events",
-                "transformations": [
-                    "sessionize",
-                    "feature_extraction",
-                    "ml_inference"
-                ],
-                "output": "user_insights_db"
-            },
-            "ai_performance": {
-                "input": "ai_metrics",
-                "transformations": [
-                    "aggregation",
-                    "anomaly_detection",
-                    "trend_analysis"
-                ],
-                "output": "performance_dashboard"
-            }
-        },
-        "ml_models": {
-            "churn_prediction": {
-                "type": "xgboost",
-                "features": ["usage_frequency", "feature_adoption", "support_tickets"],
-                "target": "churned_30d"
-            },
-            "usage_optimization": {
-                "type": "collaborative_filtering",
-                "purpose": "recommend_features"
-            }
-        }
-    }
-    
-    with open("config/analytics_config.json", "w") as f:
-        json.dump(analytics_config, f, indent=2)
-    
-    print("  ✅ Advanced analytics configuration created")
-
-def create_enterprise_integrations():
-    """Create enterprise integrations"""
-    print_step("🔌", "CREATING ENTERPRISE INTEGRATIONS")
-    
-    # Create infrastructure directories
-    os.makedirs("infrastructure/istio", exist_ok=True)
-    os.makedirs("config", exist_ok=True)
-    
-    # Create API gateway configuration
-    api_gateway_config = """
-apiVersion: networking.istio.io/v1beta1
+# Istio gateway and virtual service
+API_GATEWAY_CONFIG = """apiVersion: networking.istio.io/v1beta1
 kind: Gateway
 metadata:
   name: vetrai-gateway
@@ -704,11 +408,379 @@ spec:
       attempts: 3
       perTryTimeout: 30s
 """
+
+def print_header(title):
+    print(f"\n{HEADER_RULE}\n🚀 {title}\n{HEADER_RULE}")
+
+def print_step(step, description):
+    print(f"\n{step} {description}\n{STEP_RULE}")
+
+def create_output_dirs():
+    """Create all output directories in a single pass"""
+    for directory in OUTPUT_DIRS:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+def encode_json(data):
+    """Encode data as indented JSON, using orjson's C encoder when available"""
+    # Normal runs copy the baked assets, so only the builders pay for importing an encoder
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+def file_matches(path, data):
+    """Check whether the file at path already holds exactly these bytes"""
+    try:
+        return path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+def encode_output(content):
+    """Turn generated content into the bytes written to disk"""
+    return content.encode("utf-8") if isinstance(content, str) else content
+
+def write_output(path, content):
+    """Write one generated file unless it already holds this content"""
+    data = encode_output(content)
+    path = Path(path)
+    # Leave unchanged files alone so their mtimes don't trip make, Docker or file watchers
+    if file_matches(path, data):
+        return False
+    
+    path.write_bytes(data)
+    return True
+
+async def file_matches_async(path, data):
+    """Async version of file_matches using aiofiles"""
+    try:
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read() == data
+    except FileNotFoundError:
+        return False
+
+async def write_output_async(path, content):
+    """Async version of write_output, falling back to a worker thread without aiofiles"""
+    if not AIOFILES_AVAILABLE:
+        return await asyncio.to_thread(write_output, path, content)
+    
+    data = encode_output(content)
+    if await file_matches_async(path, data):
+        return False
+    
+    async with aiofiles.open(path, "wb") as f:
+        await f.write(data)
+    return True
+
+def baked_json(name, build):
+    """Return a baked config from assets/baked, building it if the asset is missing"""
+    try:
+        return (BAKED_DIR / name).read_bytes()
+    except FileNotFoundError:
+        return build()
+
+@functools.lru_cache(maxsize=1)
+def grafana_dashboard_json():
+    """Executive Grafana dashboard, encoded once per process"""
+    # Create advanced Grafana dashboard configuration
+    grafana_dashboard = {
+        "dashboard": {
+            "title": "VetrAI Platform - Executive Dashboard",
+            "panels": [
+                {
+                    "title": "Business Metrics",
+                    "type": "stat",
+                    "targets": [
+                        {"expr": "sum(vetrai_total_users)", "legendFormat": "Total Users"},
+                        {"expr": "sum(vetrai_active_organizations)", "legendFormat": "Active Orgs"},
+                        {"expr": "sum(vetrai_monthly_revenue)", "legendFormat": "Monthly Revenue"},
+                        {"expr": "sum(vetrai_ai_workflows_created)", "legendFormat": "AI Workflows"}
+                    ]
+                },
+                {
+                    "title": "AI Performance",
+                    "type": "graph",
+                    "targets": [
+                        {"expr": "rate(vetrai_ai_requests_total[5m])", "legendFormat": "AI Requests/sec"},
+                        {"expr": "histogram_quantile(0.95, vetrai_ai_request_duration_seconds)", "legendFormat": "95th percentile latency"},
+                        {"expr": "rate(vetrai_ai_errors_total[5m])", "legendFormat": "Error Rate"}
+                    ]
+                },
+                {
+                    "title": "Service Health Matrix",
+                    "type": "heatmap",
+                    "targets": [
+                        {"expr": "up{job=~'vetrai-.*'}", "legendFormat": "Service Status"}
+                    ]
+                }
+            ]
+        }
+    }
+    return encode_json(grafana_dashboard)
+
+def create_advanced_monitoring():
+    """Create comprehensive monitoring and alerting system"""
+    print_step("📊", "CREATING ADVANCED MONITORING SYSTEM")
+    
+    print("  ✅ Advanced Grafana dashboard prepared")
+    print("  ✅ Alerting rules prepared")
+    
+    return [
+        ("monitoring/grafana_advanced_dashboard.json", baked_json("grafana_advanced_dashboard.json", grafana_dashboard_json)),
+        ("monitoring/alerting_rules.yml", ALERTING_RULES)
+    ]
+
+@functools.lru_cache(maxsize=1)
+def auth_config_json():
+    """OAuth2/OIDC and RBAC configuration, encoded once per process"""
+    # Create OAuth2/OIDC integration
+    oauth_config = {
+        "providers": {
+            "google": {
+                "client_id": "${GOOGLE_CLIENT_ID}",
+                "client_secret": "${GOOGLE_CLIENT_SECRET}",
+                "redirect_uri": "https://yourdomain.com/auth/google/callback"
+            },
+            "microsoft": {
+                "client_id": "${MICROSOFT_CLIENT_ID}",
+                "client_secret": "${MICROSOFT_CLIENT_SECRET}",
+                "tenant": "${MICROSOFT_TENANT_ID}"
+            },
+            "okta": {
+                "issuer": "${OKTA_ISSUER}",
+                "client_id": "${OKTA_CLIENT_ID}",
+                "client_secret": "${OKTA_CLIENT_SECRET}"
+            }
+        },
+        "jwt": {
+            "secret": "${JWT_SECRET}",
+            "expiry": "24h",
+            "refresh_expiry": "7d"
+        },
+        "rbac": {
+            "roles": ["admin", "manager", "developer", "viewer"],
+            "permissions": {
+                "admin": ["*"],
+                "manager": ["read:*", "write:workflows", "manage:team"],
+                "developer": ["read:*", "write:workflows", "execute:ai"],
+                "viewer": ["read:workflows", "read:results"]
+            }
+        }
+    }
+    return encode_json(oauth_config)
+
+def implement_advanced_security():
+    """Implement enterprise security features"""
+    print_step("🔐", "IMPLEMENTING ENTERPRISE SECURITY")
+    
+    print("  ✅ OAuth2/OIDC configuration prepared")
+    print("  ✅ Rate limiting configuration prepared")
+    
+    return [
+        ("config/auth_config.json", baked_json("auth_config.json", auth_config_json)),
+        ("config/rate_limiting.yml", RATE_LIMITING)
+    ]
+
+@functools.lru_cache(maxsize=1)
+def ai_templates_json():
+    """Enterprise AI workflow templates, encoded once per process"""
+    ai_templates = {
+        "document_processing": {
+            "name": "Document Intelligence Pipeline",
+            "description": "Extract, analyze, and categorize documents using AI",
+            "nodes": [
+                {
+                    "id": "doc_upload",
+                    "type": "file_input",
+                    "config": {"accepted_types": ["pdf", "docx", "txt"]}
+                },
+                {
+                    "id": "ocr_extraction",
+                    "type": "ai_ocr",
+                    "config": {"engine": "tesseract", "languages": ["en", "es", "fr"]}
+                },
+                {
+                    "id": "text_analysis",
+                    "type": "llm_analysis",
+                    "config": {
+                        **MODEL_CONFIGS["gpt4"],
+                        "tasks": ["sentiment", "entities", "classification"]
+                    }
+                },
+                {
+                    "id": "data_storage",
+                    "type": "database_insert",
+                    "config": {"table": "processed_documents"}
+                }
+            ]
+        },
+        "customer_support_automation": {
+            "name": "AI Customer Support Agent",
+            "description": "Automated customer support with escalation",
+            "nodes": [
+                {
+                    "id": "query_input",
+                    "type": "text_input",
+                    "config": {"source": "chat", "webhook": "/api/support"}
+                },
+                {
+                    "id": "intent_classification",
+                    "type": "llm_classifier",
+                    "config": {
+                        **MODEL_CONFIGS["claude3"],
+                        "classes": ["technical", "billing", "general", "complaint"]
+                    }
+                },
+                {
+                    "id": "knowledge_search",
+                    "type": "vector_search",
+                    "config": {"index": "support_kb", "top_k": 5}
+                },
+                {
+                    "id": "response_generation",
+                    "type": "llm_response",
+                    "config": MODEL_CONFIGS["gpt4_low_temp"]
+                },
+                {
+                    "id": "escalation_check",
+                    "type": "conditional",
+                    "config": {"condition": "confidence < 0.8"}
+                }
+            ]
+        },
+        "data_analytics_pipeline": {
+            "name": "Real-time Data Analytics",
+            "description": "Process and analyze streaming data with AI insights",
+            "nodes": [
+                {
+                    "id": "data_ingestion",
+                    "type": "stream_input",
+                    "config": {"source": "kafka", "topic": "user_events"}
+                },
+                {
+                    "id": "data_cleaning",
+                    "type": "data_processor",
+                    "config": {"operations": ["normalize", "validate", "enrich"]}
+                },
+                {
+                    "id": "anomaly_detection",
+                    "type": "ml_detector",
+                    "config": {"algorithm": "isolation_forest", "threshold": 0.05}
+                },
+                {
+                    "id": "trend_analysis",
+                    "type": "llm_analyst",
+                    "config": {**MODEL_CONFIGS["claude3"], "analysis_type": "trends"}
+                },
+                {
+                    "id": "dashboard_update",
+                    "type": "websocket_emit",
+                    "config": {"channel": "analytics_dashboard"}
+                }
+            ]
+        }
+    }
+    return encode_json(ai_templates)
+
+def create_ai_workflow_templates():
+    """Create advanced AI workflow templates"""
+    print_step("🤖", "CREATING ADVANCED AI WORKFLOW TEMPLATES")
+    
+    print("  ✅ Enterprise AI workflow templates prepared")
+    
+    return [("templates/ai_workflows/enterprise_templates.json", baked_json("enterprise_templates.json", ai_templates_json))]
+
+def setup_production_infrastructure():
+    """Setup production-ready infrastructure configurations"""
+    print_step("🏗️", "SETTING UP PRODUCTION INFRASTRUCTURE")
+    
+    print("  ✅ Infrastructure as Code templates prepared")
+    
+    return [
+        ("infrastructure/k8s/auth-service.yaml", K8S_MANIFESTS),
+        ("infrastructure/terraform/main.tf", TERRAFORM_CONFIG)
+    ]
+
+def create_ci_cd_pipeline():
+    """Create comprehensive CI/CD pipeline"""
+    print_step("🔄", "CREATING CI/CD PIPELINE")
+    
+    print("  ✅ GitHub Actions CI/CD pipeline prepared")
+    
+    return [(".github/workflows/ci-cd.yml", GITHUB_ACTIONS)]
+
+@functools.lru_cache(maxsize=1)
+def analytics_config_json():
+    """Analytics pipelines and ML models, encoded once per process"""
+    # Create analytics service configuration
+    analytics_config = {
+        "data_sources": {
+            "user_events": {
+                "type": "kafka",
+                "topic": "user.events",
+                "schema": {
+                    "user_id": "string",
+                    "event_type": "string",
+                    "timestamp": "datetime",
+                    "properties": "json"
+                }
+            },
+            "ai_metrics": {
+                "type": "prometheus",
+                "metrics": [
+                    "ai_request_duration",
+                    "ai_request_count",
+                    "model_accuracy",
+                    "token_usage"
+                ]
+            }
+        },
+        "analytics_pipelines": {
+            "user_behavior": {
+                "input": "user_events",
+                "transformations": [
+                    "sessionize",
+                    "feature_extraction",
+                    "ml_inference"
+                ],
+                "output": "user_insights_db"
+            },
+            "ai_performance": {
+                "input": "ai_metrics",
+                "transformations": [
+                    "aggregation",
+                    "anomaly_detection",
+                    "trend_analysis"
+                ],
+                "output": "performance_dashboard"
+            }
+        },
+        "ml_models": {
+            "churn_prediction": {
+                "type": "xgboost",
+                "features": ["usage_frequency", "feature_adoption", "support_tickets"],
+                "target": "churned_30d"
+            },
+            "usage_optimization": {
+                "type": "collaborative_filtering",
+                "purpose": "recommend_features"
+            }
+        }
+    }
+    return encode_json(analytics_config)
+
+def implement_advanced_analytics():
+    """Implement advanced analytics and insights"""
+    print_step("📈", "IMPLEMENTING ADVANCED ANALYTICS")
     
-    os.makedirs("infrastructure/istio", exist_ok=True)
-    with open("infrastructure/istio/gateway.yaml", "w") as f:
-        f.write(api_gateway_config)
+    print("  ✅ Advanced analytics configuration prepared")
     
+    return [("config/analytics_config.json", baked_json("analytics_config.json", analytics_config_json))]
+
+@functools.lru_cache(maxsize=1)
+def integrations_json():
+    """Slack, Teams and Datadog integrations, encoded once per process"""
     # Create webhook integration templates
     webhook_integrations = {
         "slack": {
@@ -755,26 +827,50 @@ spec:
             ]
         }
     }
+    return encode_json(webhook_integrations)
+
+def create_enterprise_integrations():
+    """Create enterprise integrations"""
+    print_step("🔌", "CREATING ENTERPRISE INTEGRATIONS")
     
-    with open("config/integrations.json", "w") as f:
-        json.dump(webhook_integrations, f, indent=2)
+    print("  ✅ Enterprise integrations prepared")
     
-    print("  ✅ Enterprise integrations configured")
+    return [
+        ("infrastructure/istio/gateway.yaml", API_GATEWAY_CONFIG),
+        ("config/integrations.json", baked_json("integrations.json", integrations_json))
+    ]
 
-def main():
-    """Main function to implement all next level enhancements"""
+# Asset name and builder for every baked config, used by scripts/bake_configs.py
+BAKED_CONFIGS = (
+    ("grafana_advanced_dashboard.json", grafana_dashboard_json),
+    ("auth_config.json", auth_config_json),
+    ("enterprise_templates.json", ai_templates_json),
+    ("analytics_config.json", analytics_config_json),
+    ("integrations.json", integrations_json)
+)
+
+def print_intro():
+    """Print the opening banner"""
     print_header("VETRAI PLATFORM - NEXT LEVEL ENHANCEMENTS")
     
     print("🎯 Taking your VetrAI platform to enterprise-grade production level...")
-    
-    # Create all enhancements
-    create_advanced_monitoring()
-    implement_advanced_security()
-    create_ai_workflow_templates()
-    setup_production_infrastructure()
-    create_ci_cd_pipeline()
-    implement_advanced_analytics()
-    create_enterprise_integrations()
+
+def build_outputs():
+    """Run every generator and collect the (path, content) pairs to write"""
+    generators = (
+        create_advanced_monitoring,
+        implement_advanced_security,
+        create_ai_workflow_templates,
+        setup_production_infrastructure,
+        create_ci_cd_pipeline,
+        implement_advanced_analytics,
+        create_enterprise_integrations
+    )
+    return [output for generator in generators for output in generator()]
+
+def print_summary(written, total):
+    """Print the write counts and what the platform now includes"""
+    print(f"\n📝 Files written: {written}, unchanged: {total - written}")
     
     print_header("NEXT LEVEL ENHANCEMENTS COMPLETE")
     
@@ -796,5 +892,35 @@ def main():
     
     print("\n🚀 Your platform is now ENTERPRISE-GRADE!")
 
+def main():
+    """Main function to implement all next level enhancements"""
+    # Collect the progress report in memory and write it out in one go
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            print_intro()
+            
+            # Build all enhancements, then write the independent files in parallel
+            outputs = build_outputs()
+            create_output_dirs()
+            with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+                written = sum(executor.map(write_output, *zip(*outputs)))
+            
+            print_summary(written, len(outputs))
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+async def amain():
+    """Async variant of main() for callers that already run an event loop"""
+    # Printed directly: redirecting stdout would also capture other tasks' output
+    print_intro()
+    
+    outputs = build_outputs()
+    create_output_dirs()
+    written = sum(await asyncio.gather(*(write_output_async(path, content) for path, content in outputs)))
+    
+    print_summary(written, len(outputs))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,9 +4,22 @@ VetrAI Platform - Production Deployment Checklist
 Complete guide for your next steps
 """
 
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from next_level_enhancements import write_output
+
+# Section rule, built once rather than on every banner
+RULE = "=" * 60
+
+# Production deployment helper, checked in as a repo asset and copied into place
+DEPLOY_SCRIPT_ASSET = Path(__file__).resolve().parent / "assets" / "deploy_production.sh"
+
 def production_deployment_guide():
     print("🚀 VETRAI PLATFORM - PRODUCTION DEPLOYMENT GUIDE")
-    print("=" * 60)
+    print(RULE)
     
     print("\n📋 PRE-DEPLOYMENT CHECKLIST:")
     print("   ✅ All 8 backend services operational")
@@ -47,9 +60,9 @@ def production_deployment_guide():
     print("   • CDN setup")
 
 def show_immediate_actions():
-    print("\n" + "=" * 60)
+    print("\n" + RULE)
     print("⚡ IMMEDIATE ACTIONS YOU CAN TAKE RIGHT NOW:")
-    print("=" * 60)
+    print(RULE)
     
     print("\n🔥 OPTION A: START BUILDING (0 minutes)")
     print("   1. Visit: http://localhost:3000 (Studio UI)")
@@ -70,92 +83,37 @@ def show_immediate_actions():
     print("   4. Configure CI/CD pipeline")
 
 def create_production_deploy_script():
-    """Create a simple production deployment helper"""
-    
-    deployment_script = '''#!/bin/bash
-# VetrAI Platform - Production Deployment Helper
-# Run this script to deploy your platform to production
-
-echo "🚀 VetrAI Platform Production Deployment"
-echo "========================================"
-
-echo "📋 Checking prerequisites..."
-
-# Check Docker
-if ! command -v docker &> /dev/null; then
-    echo "❌ Docker is required. Please install Docker first."
-    exit 1
-fi
-
-# Check Docker Compose
-if ! command -v docker-compose &> /dev/null; then
-    echo "❌ Docker Compose is required. Please install Docker Compose first."
-    exit 1
-fi
-
-echo "✅ Prerequisites check passed"
-
-echo "🏗️ Choose deployment method:"
-echo "1. Local production deployment"
-echo "2. Cloud provider deployment"
-echo "3. Development environment setup"
-
-read -p "Enter your choice (1-3): " choice
-
-case $choice in
-    1)
-        echo "🔧 Setting up local production environment..."
-        cp .env.example .env.production
-        echo "📝 Please edit .env.production with your production settings"
-        echo "🚀 Run: docker-compose -f docker-compose.prod.yml up -d"
-        ;;
-    2)
-        echo "☁️ Cloud deployment options:"
-        echo "• AWS: Upload entire project to EC2 or use ECS"
-        echo "• Azure: Use Container Apps"
-        echo "• GCP: Use Cloud Run"
-        echo "• DigitalOcean: Use App Platform"
-        echo "📋 Use the files in /scripts/setup/ for automated deployment"
-        ;;
-    3)
-        echo "💻 Development environment setup..."
-        echo "✅ Your platform is already running in development mode!"
-        echo "🔗 Studio: http://localhost:3000"
-        echo "🔗 Admin: http://localhost:3001"
-        echo "🔗 APIs: http://localhost:8001-8008/docs"
-        ;;
-    *)
-        echo "❌ Invalid choice. Please run the script again."
-        ;;
-esac
-
-echo ""
-echo "✨ VetrAI Platform deployment helper complete!"
-echo "📚 Check the documentation in /docs for detailed guides"
-'''
-    
-    with open("deploy_production.sh", "w") as f:
-        f.write(deployment_script)
-    
-    print("\n📄 Created: deploy_production.sh")
+    """Copy the production deployment helper into the working directory"""
+    # write_output skips the write when the copy is already current, so its mtime stays put
+    if write_output("deploy_production.sh", DEPLOY_SCRIPT_ASSET.read_bytes()):
+        print("\n📄 Created: deploy_production.sh")
+    else:
+        print("\n📄 Unchanged: deploy_production.sh")
     print("   Production deployment helper script")
 
 def main():
-    production_deployment_guide()
-    show_immediate_actions()
-    create_production_deploy_script()
-    
-    print("\n" + "=" * 60)
-    print("🎉 YOUR VETRAI PLATFORM IS READY!")
-    print("=" * 60)
-    print("\n🎯 RECOMMENDED IMMEDIATE ACTION:")
-    print("   Visit http://localhost:3000 and start building!")
-    print("\n📞 Support:")
-    print("   • All APIs documented at /docs endpoints")
-    print("   • Monitoring at http://localhost:3002")
-    print("   • Production scripts in /scripts/setup/")
-    
-    print("\n✨ Congratulations! You have a complete AI platform!")
+    # The output is static text: render it in memory and write it out in one go
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            production_deployment_guide()
+            show_immediate_actions()
+            create_production_deploy_script()
+            
+            print("\n" + RULE)
+            print("🎉 YOUR VETRAI PLATFORM IS READY!")
+            print(RULE)
+            print("\n🎯 RECOMMENDED IMMEDIATE ACTION:")
+            print("   Visit http://localhost:3000 and start building!")
+            print("\n📞 Support:")
+            print("   • All APIs documented at /docs endpoints")
+            print("   • Monitoring at http://localhost:3002")
+            print("   • Production scripts in /scripts/setup/")
+            
+            print("\n✨ Congratulations! You have a complete AI platform!")
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
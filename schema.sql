@@ -0,0 +1,224 @@
+-- VetrAI Platform database schema
+-- Applied by init_database.py, which splits it at each "-- ... Service Tables"
+-- header and runs the sections in file order, in one transaction on one
+-- connection. Auth and Tenancy come first because the other services reference them.
+-- Safe to run directly with psql -f as well; every statement is idempotent.
+
+-- Auth Service Tables
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    email TEXT UNIQUE NOT NULL,
+    username TEXT UNIQUE,
+    password_hash TEXT NOT NULL,
+    first_name TEXT,
+    last_name TEXT,
+    is_active BOOLEAN DEFAULT TRUE,
+    is_verified BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Sessions are short-lived and re-creatable: UNLOGGED skips WAL on every write,
+-- at the cost of the table being emptied after a crash and not replicated
+CREATE UNLOGGED TABLE IF NOT EXISTS user_sessions (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    session_token TEXT UNIQUE NOT NULL,
+    refresh_token TEXT UNIQUE,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Tenancy Service Tables
+CREATE TABLE IF NOT EXISTS tenants (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    name TEXT NOT NULL,
+    subdomain TEXT UNIQUE,
+    domain TEXT,
+    is_active BOOLEAN DEFAULT TRUE,
+    plan TEXT DEFAULT 'free',
+    settings JSONB DEFAULT '{}',
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS tenant_users (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    role TEXT DEFAULT 'member',
+    permissions JSONB DEFAULT '{}',
+    joined_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(tenant_id, user_id)
+);
+
+-- Small JSONB read on every permission check: when TOAST moves it out of line,
+-- keep it uncompressed so reads skip decompression (same for the columns below)
+ALTER TABLE tenant_users ALTER COLUMN permissions SET STORAGE EXTERNAL;
+
+-- API Keys Service Tables
+CREATE TABLE IF NOT EXISTS api_keys (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    -- Raw digest bytes, half the size of the hex text
+    key_hash BYTEA NOT NULL,
+    key_prefix TEXT NOT NULL,
+    permissions JSONB DEFAULT '[]',
+    is_active BOOLEAN DEFAULT TRUE,
+    last_used_at TIMESTAMP WITH TIME ZONE,
+    expires_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    -- Lookups go by prefix and then verify the hash: one prefix-first index
+    -- serves both and enforces uniqueness
+    CONSTRAINT api_keys_prefix_hash_key UNIQUE (key_prefix, key_hash)
+);
+
+ALTER TABLE api_keys ALTER COLUMN permissions SET STORAGE EXTERNAL;
+
+-- Partitioned by month so vacuum and recent-window queries touch only the
+-- newest partitions; init_database.py creates the partitions themselves, as
+-- UNLOGGED tables since usage telemetry can be lost in a crash
+CREATE TABLE IF NOT EXISTS api_key_usage (
+    id INTEGER GENERATED ALWAYS AS IDENTITY,
+    api_key_id INTEGER REFERENCES api_keys(id) ON DELETE CASCADE,
+    endpoint TEXT,
+    method TEXT,
+    status_code INTEGER,
+    response_time_ms INTEGER,
+    requested_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, requested_at)
+) PARTITION BY RANGE (requested_at);
+
+-- Billing Service Tables
+CREATE TABLE IF NOT EXISTS billing_accounts (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE UNIQUE,
+    plan_type TEXT DEFAULT 'free',
+    billing_cycle TEXT DEFAULT 'monthly',
+    payment_method JSONB,
+    billing_address JSONB,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS invoices (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    billing_account_id INTEGER REFERENCES billing_accounts(id) ON DELETE CASCADE,
+    invoice_number TEXT UNIQUE NOT NULL,
+    amount_cents INTEGER NOT NULL,
+    -- ISO 4217 code: the one length the application relies on
+    currency TEXT DEFAULT 'USD' CHECK (char_length(currency) = 3),
+    status TEXT DEFAULT 'pending',
+    due_date DATE,
+    paid_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Support Service Tables
+CREATE TABLE IF NOT EXISTS support_tickets (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
+    title TEXT NOT NULL,
+    description TEXT,
+    status TEXT DEFAULT 'open',
+    priority TEXT DEFAULT 'medium',
+    category TEXT,
+    assigned_to INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS ticket_messages (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    ticket_id INTEGER REFERENCES support_tickets(id) ON DELETE CASCADE,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    message TEXT NOT NULL,
+    is_internal BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Themes Service Tables
+CREATE TABLE IF NOT EXISTS themes (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    config JSONB NOT NULL,
+    is_default BOOLEAN DEFAULT FALSE,
+    is_custom BOOLEAN DEFAULT FALSE,
+    tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
+    created_by INTEGER REFERENCES users(id),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS user_theme_preferences (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    theme_id INTEGER REFERENCES themes(id) ON DELETE CASCADE,
+    preferences JSONB DEFAULT '{}',
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, theme_id)
+);
+
+-- Notifications Service Tables
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
+    title TEXT NOT NULL,
+    message TEXT,
+    type TEXT DEFAULT 'info',
+    channel TEXT DEFAULT 'in_app',
+    is_read BOOLEAN DEFAULT FALSE,
+    metadata JSONB DEFAULT '{}',
+    scheduled_at TIMESTAMP WITH TIME ZONE,
+    sent_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE notifications ALTER COLUMN metadata SET STORAGE EXTERNAL;
+
+CREATE TABLE IF NOT EXISTS notification_preferences (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    channel TEXT NOT NULL,
+    enabled BOOLEAN DEFAULT TRUE,
+    settings JSONB DEFAULT '{}',
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, channel)
+);
+
+-- Workers Service Tables
+CREATE TABLE IF NOT EXISTS background_jobs (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    job_type TEXT NOT NULL,
+    job_data JSONB NOT NULL,
+    status TEXT DEFAULT 'pending',
+    priority INTEGER DEFAULT 0,
+    max_retries INTEGER DEFAULT 3,
+    retry_count INTEGER DEFAULT 0,
+    result JSONB,
+    error_message TEXT,
+    scheduled_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP WITH TIME ZONE,
+    completed_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS workflow_executions (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    tenant_id INTEGER REFERENCES tenants(id) ON DELETE CASCADE,
+    workflow_name TEXT NOT NULL,
+    workflow_config JSONB NOT NULL,
+    status TEXT DEFAULT 'running',
+    input_data JSONB,
+    output_data JSONB,
+    error_details TEXT,
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP WITH TIME ZONE
+);
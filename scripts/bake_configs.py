@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+VetrAI Platform - Bake Enhancement Configs
+
+Pre-serializes the static JSON configs built by next_level_enhancements.py
+into assets/baked/, so the generator only has to copy them into place.
+Re-run this after changing any of those configs.
+
+Usage:
+    python scripts/bake_configs.py
+    python scripts/bake_configs.py --check    # fail if any baked asset is stale
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from next_level_enhancements import BAKED_CONFIGS, BAKED_DIR, encode_output, file_matches, write_output
+
+def check():
+    """Report baked assets that no longer match their builders, returning the stale count"""
+    stale = 0
+    for name, build in BAKED_CONFIGS:
+        if file_matches(BAKED_DIR / name, encode_output(build())):
+            print(f"✓ Up to date: assets/baked/{name}")
+        else:
+            print(f"❌ Stale: assets/baked/{name}")
+            stale += 1
+    
+    if stale:
+        print("\nRun 'python scripts/bake_configs.py' and commit the result.")
+    return stale
+
+def main():
+    """Build every baked config and refresh its asset file"""
+    parser = argparse.ArgumentParser(description='Bake the static enhancement configs')
+    parser.add_argument('--check', action='store_true',
+                        help='Only verify that assets/baked matches the builders')
+    args = parser.parse_args()
+    
+    if args.check:
+        sys.exit(1 if check() else 0)
+    
+    BAKED_DIR.mkdir(parents=True, exist_ok=True)
+    
+    for name, build in BAKED_CONFIGS:
+        if write_output(BAKED_DIR / name, build()):
+            print(f"✅ Baked assets/baked/{name}")
+        else:
+            print(f"✓ Up to date: assets/baked/{name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+-- VetrAI Platform - API key hash migration
+-- Converts api_keys.key_hash from the hex text written by earlier releases
+-- to the raw SHA-256 digest (BYTEA) the keys service now stores, and keys
+-- uniqueness on (key_prefix, key_hash). Safe to re-run.
+
+BEGIN;
+
+-- Old single-column uniqueness on the hex hash
+ALTER TABLE api_keys DROP CONSTRAINT IF EXISTS api_keys_key_hash_key;
+DROP INDEX IF EXISTS idx_api_keys_key_hash;
+
+-- Hex digests become their raw bytes, so existing keys keep validating
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'api_keys'
+          AND column_name = 'key_hash') <> 'bytea' THEN
+        ALTER TABLE api_keys ALTER COLUMN key_hash TYPE BYTEA USING decode(key_hash, 'hex');
+    END IF;
+END $$;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'api_keys_prefix_hash_key') THEN
+        ALTER TABLE api_keys ADD CONSTRAINT api_keys_prefix_hash_key UNIQUE (key_prefix, key_hash);
+    END IF;
+END $$;
+
+COMMIT;
@@ -98,7 +98,7 @@ CREATE TABLE IF NOT EXISTS api_keys (
     organization_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
     user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     name VARCHAR(255) NOT NULL,
-    key_hash VARCHAR(255) UNIQUE NOT NULL,
+    key_hash BYTEA NOT NULL,  -- raw SHA-256 digest
     key_prefix VARCHAR(20) NOT NULL,
     scopes JSONB DEFAULT '[]',
     is_active BOOLEAN NOT NULL DEFAULT TRUE,
@@ -106,12 +106,14 @@ CREATE TABLE IF NOT EXISTS api_keys (
     last_used_at TIMESTAMP,
     usage_count INTEGER DEFAULT 0,
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    -- Lookups go by prefix and then verify the hash, so one composite
+    -- unique index serves both
+    CONSTRAINT api_keys_prefix_hash_key UNIQUE (key_prefix, key_hash)
 );
 
 CREATE INDEX idx_api_keys_organization_id ON api_keys(organization_id);
 CREATE INDEX idx_api_keys_user_id ON api_keys(user_id);
-CREATE INDEX idx_api_keys_key_hash ON api_keys(key_hash);
 CREATE INDEX idx_api_keys_is_active ON api_keys(is_active);
 
 -- ============================================
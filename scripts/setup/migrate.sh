@@ -18,4 +18,8 @@ echo "✅ PostgreSQL is ready!"
 echo "📝 Running database initialization..."
 PGPASSWORD=vetrai_password psql -h localhost -U vetrai -d vetrai_db -f scripts/migration/init.sql
 
+# Convert API key hashes stored as hex by earlier releases
+echo "📝 Migrating API key hashes..."
+PGPASSWORD=vetrai_password psql -h localhost -U vetrai -d vetrai_db -v ON_ERROR_STOP=1 -f scripts/migration/api_keys_key_hash_bytea.sql
+
 echo "✅ Database migration completed successfully!"
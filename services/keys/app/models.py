@@ -7,7 +7,7 @@ from datetime import datetime
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, LargeBinary, UniqueConstraint
 from shared.models import BaseModel
 
 
@@ -15,10 +15,15 @@ class APIKey(BaseModel):
     """API key model"""
     
     __tablename__ = "api_keys"
+    # Lookups go by prefix and then verify the hash, so one composite
+    # unique index serves both (matches schema.sql)
+    __table_args__ = (
+        UniqueConstraint("key_prefix", "key_hash", name="api_keys_prefix_hash_key"),
+    )
     
     name = Column(String(100), nullable=False)
-    key_hash = Column(String(255), nullable=False, unique=True, index=True)
-    key_prefix = Column(String(20), nullable=False, index=True)
+    key_hash = Column(LargeBinary(32), nullable=False)  # raw SHA-256 digest
+    key_prefix = Column(String(20), nullable=False)
     user_id = Column(Integer, nullable=False, index=True)
     organization_id = Column(Integer, nullable=False, index=True)
     
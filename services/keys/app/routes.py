@@ -30,9 +30,9 @@ router = APIRouter()
 settings = get_settings()
 
 
-def hash_api_key(key: str) -> str:
-    """Hash an API key for storage"""
-    return hashlib.sha256(key.encode()).hexdigest()
+def hash_api_key(key: str) -> bytes:
+    """Hash an API key for storage as raw SHA-256 digest bytes"""
+    return hashlib.sha256(key.encode()).digest()
 
 
 @router.post("/", response_model=APIKeyCreateResponse, status_code=status.HTTP_201_CREATED)
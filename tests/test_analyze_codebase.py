@@ -0,0 +1,182 @@
+"""
+Tests for analyze_codebase.py: skipped files, the regex fallback and the results cache
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import analyze_codebase
+from analyze_codebase import CodeAnalyzer, SkippedFileError
+
+
+def make_analyzer(repo):
+    return CodeAnalyzer(repo_path=str(repo))
+
+
+def cache_key(repo):
+    analyzer = make_analyzer(repo)
+    return analyzer._compute_cache_key({})
+
+
+# ============================================
+# Skipped files
+# ============================================
+
+def test_binary_file_is_skipped(tmp_path):
+    binary = tmp_path / "blob.py"
+    binary.write_bytes(b"import os\x00\x01\x02")
+    analyzer = make_analyzer(tmp_path)
+    
+    with pytest.raises(SkippedFileError):
+        analyzer._read_text(binary)
+    assert analyzer.results["skipped_files"] == {"blob.py": "binary content"}
+
+
+def test_oversized_file_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(analyze_codebase, "MAX_SOURCE_FILE_SIZE", 16)
+    large = tmp_path / "large.py"
+    large.write_text("x = 1\n" * 10)
+    analyzer = make_analyzer(tmp_path)
+    
+    with pytest.raises(SkippedFileError):
+        analyzer._read_text(large)
+    assert "large.py" in analyzer.results["skipped_files"]
+
+
+def test_skipped_file_does_not_stop_quality_analysis(tmp_path):
+    (tmp_path / "blob.py").write_bytes(b"\x00" * 8)
+    (tmp_path / "good.py").write_text('"""Documented"""\n')
+    analyzer = make_analyzer(tmp_path)
+    
+    analyzer.analyze_code_quality()
+    quality = analyzer.results["quality"]
+    assert quality["python_files_with_docstrings"] == 1
+    assert "blob.py" in analyzer.results["skipped_files"]
+
+
+# ============================================
+# Regex fallback for unparseable sources
+# ============================================
+
+def test_routes_fall_back_to_regex_on_syntax_error(tmp_path):
+    routes = tmp_path / "routes.py"
+    routes.write_text(
+        '@router.get("/items")\n'
+        'def list_items(:\n'
+        '@app.post(\'/items\')\n'
+    )
+    analyzer = make_analyzer(tmp_path)
+    
+    assert analyzer._parse_module(routes) is None
+    assert analyzer._extract_endpoints(routes) == ["GET /items", "POST /items"]
+
+
+def test_models_fall_back_to_regex_on_syntax_error(tmp_path):
+    models = tmp_path / "models.py"
+    models.write_text(
+        'class User(Base):\n'
+        '    id = Column(\n'
+        'class Plain(object):\n'
+    )
+    analyzer = make_analyzer(tmp_path)
+    
+    assert analyzer._parse_module(models) is None
+    assert analyzer._extract_models(models) == ["User"]
+
+
+def test_routes_and_models_use_ast_when_parseable(tmp_path):
+    source = tmp_path / "app.py"
+    source.write_text(
+        'class User(Base):\n'
+        '    pass\n'
+        '\n'
+        '@router.delete("/users/{user_id}")\n'
+        'async def delete_user(user_id):\n'
+        '    pass\n'
+    )
+    analyzer = make_analyzer(tmp_path)
+    
+    assert analyzer._extract_endpoints(source) == ["DELETE /users/{user_id}"]
+    assert analyzer._extract_models(source) == ["User"]
+
+
+# ============================================
+# Results cache
+# ============================================
+
+def test_cache_key_changes_when_python_source_changes(tmp_path):
+    source = tmp_path / "main.py"
+    source.write_text("x = 1\n")
+    key, _ = cache_key(tmp_path)
+    
+    source.write_text("x = 2\n")
+    assert cache_key(tmp_path)[0] != key
+
+
+def test_cache_key_ignores_content_of_unanalyzed_files(tmp_path):
+    (tmp_path / "main.py").write_text("x = 1\n")
+    asset = tmp_path / "logo.png"
+    asset.write_bytes(b"first")
+    key, signatures = cache_key(tmp_path)
+    
+    # Only files the analyzers read are hashed
+    assert set(signatures) == {"main.py"}
+    
+    asset.write_bytes(b"second version")
+    assert cache_key(tmp_path)[0] == key
+
+
+def test_cache_key_changes_when_files_are_added_or_removed(tmp_path):
+    (tmp_path / "main.py").write_text("x = 1\n")
+    key, _ = cache_key(tmp_path)
+    
+    asset = tmp_path / "logo.png"
+    asset.write_bytes(b"png")
+    added_key, _ = cache_key(tmp_path)
+    assert added_key != key
+    
+    asset.unlink()
+    assert cache_key(tmp_path)[0] == key
+
+
+def test_cache_key_reuses_digest_for_unchanged_files(tmp_path, monkeypatch):
+    (tmp_path / "main.py").write_text("x = 1\n")
+    key, signatures = make_analyzer(tmp_path)._compute_cache_key({})
+    
+    def fail_read(self):
+        raise AssertionError("unchanged file was re-hashed")
+    
+    monkeypatch.setattr(Path, "read_bytes", fail_read)
+    assert make_analyzer(tmp_path)._compute_cache_key(signatures)[0] == key
+
+
+def test_analyze_reuses_cache_until_source_changes(tmp_path, capsys):
+    source = tmp_path / "main.py"
+    source.write_text('"""Entry point"""\n')
+    make_analyzer(tmp_path).analyze()
+    assert (tmp_path / analyze_codebase.CACHE_FILE_NAME).exists()
+    capsys.readouterr()
+    
+    make_analyzer(tmp_path).analyze()
+    assert "reusing cached analysis results" in capsys.readouterr().out
+    
+    source.write_text('x = 1\n')
+    results = make_analyzer(tmp_path).analyze()
+    assert "reusing cached analysis results" not in capsys.readouterr().out
+    assert results["quality"]["python_files_without_docstrings"] == 1
+
+
+# ============================================
+# Code quality
+# ============================================
+
+def test_docstring_pct_is_zero_without_python_files(tmp_path):
+    (tmp_path / "README.md").write_text("# Docs\n")
+    analyzer = make_analyzer(tmp_path)
+    
+    analyzer.analyze_code_quality()
+    assert analyzer.results["quality"]["docstring_pct"] == 0.0